@@ -2,8 +2,10 @@
 """Functionality for data/records.bib and git repository."""
 from __future__ import annotations
 
+import io
 import os
-import tempfile
+import pickle  # nosec
+import shutil
 import time
 import typing
 from pathlib import Path
@@ -13,6 +15,7 @@ import git
 from git import GitCommandError
 from git import InvalidGitRepositoryError
 
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.bib
 import colrev.loader.load_utils
@@ -27,6 +30,9 @@ from colrev.constants import FileSets
 from colrev.constants import RecordState
 from colrev.writer.write_utils import to_string
 
+# Do not fetch from the remote again within this interval (in seconds)
+FETCH_INTERVAL = 60
+
 # pylint: disable=too-many-public-methods
 
 
@@ -37,6 +43,11 @@ class Dataset:
 
     def __init__(self, *, review_manager: colrev.review_manager.ReviewManager) -> None:
         self.review_manager = review_manager
+        self._id_setter: typing.Optional[colrev.record.record_id_setter.IDSetter] = None
+        # (signature of the records file, pickled records) of the last full load
+        self._records_cache: typing.Tuple[tuple, typing.Optional[bytes]] = ((), None)
+        # (branch commit, tracking branch commit) -> [behind, ahead]
+        self._remote_commit_differences_cache: typing.Dict[tuple, list] = {}
 
         try:
             # In most cases, the repo should exist
@@ -81,49 +92,42 @@ class Dataset:
         """
 
         current_origin_states_dict = {}
-        if records_string != "":
-            with tempfile.NamedTemporaryFile(
-                mode="wb", delete=False, suffix=".bib"
-            ) as temp_file:
-                temp_file.write(records_string.encode("utf-8"))
-                temp_file_path = Path(temp_file.name)
-            bib_loader = colrev.loader.bib.BIBLoader(
-                filename=temp_file_path,
-                logger=self.review_manager.logger,
-                unique_id_field="ID",
-            )
-        else:
-            bib_loader = colrev.loader.bib.BIBLoader(
-                filename=self.review_manager.paths.records,
-                logger=self.review_manager.logger,
-                unique_id_field="ID",
-            )
-        for record_header_item in bib_loader.get_record_header_items().values():
+        bib_loader = colrev.loader.bib.BIBLoader(
+            filename=self.review_manager.paths.records,
+            logger=self.review_manager.logger,
+            unique_id_field="ID",
+        )
+        file_object = io.StringIO(records_string) if records_string != "" else None
+        for record_header_item in bib_loader.get_record_header_items(
+            file_object=file_object
+        ).values():
             for origin in record_header_item[Fields.ORIGIN]:
                 current_origin_states_dict[origin] = record_header_item[Fields.STATUS]
         return current_origin_states_dict
 
     def get_committed_origin_state_dict(self) -> dict:
         """Get the committed origin_state_dict"""
-        revlist = (
-            (
-                commit.hexsha,
-                (
-                    commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
-                ).data_stream.read(),
-            )
-            for commit in self._git_repo.iter_commits(
-                paths=self.review_manager.paths.RECORDS_FILE_GIT
-            )
+        # Only the blob of the latest commit is read
+        last_commit = next(
+            self._git_repo.iter_commits(
+                paths=self.review_manager.paths.RECORDS_FILE_GIT, max_count=1
+            ),
+            None,
         )
-        filecontents = list(revlist)[0][1]
+        if last_commit is None:
+            return {}
+        filecontents = (
+            last_commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
+        ).data_stream.read()
 
         committed_origin_state_dict = self.get_origin_state_dict(
             filecontents.decode("utf-8")
         )
         return committed_origin_state_dict
 
-    def load_records_from_history(self, commit_sha: str = "") -> typing.Iterator[dict]:
+    def load_records_from_history(
+        self, commit_sha: str = "", *, header_only: bool = False
+    ) -> typing.Iterator[dict]:
         """
         Iterates through Git history, yielding records file contents as dictionaries.
 
@@ -134,6 +138,8 @@ class Dataset:
         Parameters:
             commit_sha (str, optional): Start iteration from this commit SHA.
             Defaults to beginning of Git history if not provided.
+            header_only (bool, optional): Only parse the record header items
+            (ID, origin, status, ...), which is much faster than a full parse.
 
         Yields:
             dict: Records file contents at a specific Git history point, as a dictionary.
@@ -156,11 +162,20 @@ class Dataset:
                 current_commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
             ).data_stream.read()
 
-            records_dict = colrev.loader.load_utils.loads(
-                load_string=filecontents.decode("utf-8", "replace"),
-                implementation="bib",
-                logger=self.review_manager.logger,
-            )
+            if header_only:
+                records_dict = colrev.loader.bib.BIBLoader(
+                    filename=self.review_manager.paths.records,
+                    logger=self.review_manager.logger,
+                    unique_id_field="ID",
+                ).get_record_header_items(
+                    file_object=io.StringIO(filecontents.decode("utf-8", "replace"))
+                )
+            else:
+                records_dict = colrev.loader.load_utils.loads(
+                    load_string=filecontents.decode("utf-8", "replace"),
+                    implementation="bib",
+                    logger=self.review_manager.logger,
+                )
             if records_dict:
                 yield records_dict
 
@@ -195,17 +210,29 @@ class Dataset:
             )
             return bib_loader.get_record_header_items()
 
-        if self.review_manager.paths.records.is_file():
-
-            records_dict = colrev.loader.load_utils.load(
-                filename=self.review_manager.paths.records,
-                logger=self.review_manager.logger,
-                unique_id_field="ID",
-            )
-
-        else:
-            records_dict = {}
-
+        # Parsing is expensive: reuse the records if the file did not change
+        # (the signature also covers in-place writes by other programs)
+        # Unpickling returns a fresh copy that callers can modify
+        file_key = colrev.env.utils.get_file_signature(
+            self.review_manager.paths.records
+        )
+        if not file_key:
+            return {}
+        if file_key == self._records_cache[0] and self._records_cache[1] is not None:
+            return pickle.loads(self._records_cache[1])  # nosec
+
+        records_dict = colrev.loader.load_utils.load(
+            filename=self.review_manager.paths.records,
+            logger=self.review_manager.logger,
+            unique_id_field="ID",
+        )
+        # Only keep a copy once the same file is loaded repeatedly
+        # (most operations load the records once)
+        repeated_load = file_key == self._records_cache[0]
+        self._records_cache = (
+            file_key,
+            pickle.dumps(records_dict) if repeated_load else None,
+        )
         return records_dict
 
     def save_records_dict_to_file(self, records: dict) -> None:
@@ -214,12 +241,26 @@ class Dataset:
         # operating outside a CoLRev repo (e.g., sync)
 
         bibtex_str = to_string(records_dict=records, implementation="bib")
-
-        with open(self.review_manager.paths.records, "w", encoding="utf-8") as out:
-            out.write(bibtex_str + "\n")
-
+        self._write_records_file((bibtex_str + "\n").encode("utf-8"))
         self._add_record_changes()
 
+    def _write_records_file(self, content: bytes) -> None:
+        # Write to a temporary file and replace the records file atomically
+        # (a single fsync instead of leaving a partially written file on errors)
+        # Note: resolve symlinks to replace the target (not the link itself)
+        records_file = self.review_manager.paths.records.resolve()
+        temp_file = records_file.with_name(records_file.name + ".tmp")
+        try:
+            with open(temp_file, "wb") as file:
+                file.write(content)
+                file.flush()
+                os.fsync(file.fileno())
+            if records_file.is_file():
+                shutil.copymode(records_file, temp_file)
+            os.replace(temp_file, records_file)
+        finally:
+            temp_file.unlink(missing_ok=True)
+
     def _save_record_list_by_id(self, records: dict) -> None:
 
         parsed = to_string(records_dict=records, implementation="bib")
@@ -232,49 +273,27 @@ class Dataset:
         ]
         # Correct the first item
         record_list[0]["record"] = "@" + record_list[0]["record"][2:]
+        replacements = {x[Fields.ID]: x["record"] for x in record_list}
 
-        current_id_str = "NOTSET"
+        # Replace the records in a single pass and write the file once
+        # (instead of splicing each record into the file)
+        output = []
         if self.review_manager.paths.records.is_file():
-            with open(self.review_manager.paths.records, "r+b") as file:
-                seekpos = file.tell()
-                line = file.readline()
-                while line:
+            with open(self.review_manager.paths.records, "rb") as file:
+                skip_record = False
+                for line in file:
                     if b"@" in line[:3]:
                         current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
-                        current_id_str = current_id.decode("utf-8")
-                    if current_id_str in [x[Fields.ID] for x in record_list]:
-                        replacement = [
-                            x["record"]
-                            for x in record_list
-                            if x[Fields.ID] == current_id_str
-                        ][0]
-                        record_list = [
-                            x for x in record_list if x[Fields.ID] != current_id_str
-                        ]
-                        line = file.readline()
-                        while (
-                            b"@" not in line[:3] and line
-                        ):  # replace: drop the current record
-                            line = file.readline()
-                        remaining = line + file.read()
-                        file.seek(seekpos)
-                        file.write(replacement.encode("utf-8"))
-                        seekpos = file.tell()
-                        file.flush()
-                        os.fsync(file)
-                        file.write(remaining)
-                        file.truncate()  # if the replacement is shorter...
-                        file.seek(seekpos)
-
-                    seekpos = file.tell()
-                    line = file.readline()
-
-        if len(record_list) > 0:
-            with open(
-                self.review_manager.paths.records, "a", encoding="utf8"
-            ) as m_refs:
-                for item in record_list:
-                    m_refs.write(item["record"])
+                        replacement = replacements.pop(current_id.decode("utf-8"), None)
+                        # replace: drop the current record
+                        skip_record = replacement is not None
+                        if skip_record:
+                            output.append(replacement.encode("utf-8"))
+                    if not skip_record:
+                        output.append(line)
+
+        output.extend(record.encode("utf-8") for record in replacements.values())
+        self._write_records_file(b"".join(output))
 
         self._add_record_changes()
 
@@ -292,13 +311,13 @@ class Dataset:
         # Note : matches conditions connected with 'OR'
         records = self.load_records_dict()
 
-        records_list = []
-        for _, record in records.items():
-            for condition in conditions:
-                for key, value in condition.items():
-                    if str(value) == str(record[key]):
-                        records_list.append(record)
-        yield from records_list
+        for record in records.values():
+            if any(
+                str(value) == str(record[key])
+                for condition in conditions
+                for key, value in condition.items()
+            ):
+                yield record
 
     def format_records_file(self) -> dict:
         """Format the records file (Entrypoint for pre-commit hooks)"""
@@ -358,12 +377,20 @@ class Dataset:
     def set_ids(self, selected_ids: typing.Optional[list] = None) -> dict:
         """Set the IDs of records according to predefined formats or
         according to the LocalIndex"""
-        id_setter = colrev.record.record_id_setter.IDSetter(
-            id_pattern=self.review_manager.settings.project.id_pattern,
-            skip_local_index=self.review_manager.settings.is_curated_masterdata_repo(),
-        )
+        id_pattern = self.review_manager.settings.project.id_pattern
+        skip_local_index = self.review_manager.settings.is_curated_masterdata_repo()
+        # Reuse the IDSetter (and its LocalIndex) across calls (e.g., per source in load)
+        if (
+            self._id_setter is None
+            or self._id_setter.id_pattern != id_pattern
+            or self._id_setter.skip_local_index != skip_local_index
+        ):
+            self._id_setter = colrev.record.record_id_setter.IDSetter(
+                id_pattern=id_pattern,
+                skip_local_index=skip_local_index,
+            )
         records = self.load_records_dict()
-        updated_records = id_setter.set_ids(
+        updated_records = self._id_setter.set_ids(
             records=records,
             selected_ids=selected_ids,
         )
@@ -464,9 +491,11 @@ class Dataset:
 
     def records_changed(self) -> bool:
         """Check whether the records were changed"""
-        main_recs_changed = self.review_manager.paths.RECORDS_FILE_GIT in [
-            item.a_path for item in self._git_repo.index.diff(None)
-        ] + [x.a_path for x in self._git_repo.head.commit.diff()]
+        # Only diff the records file (instead of the whole working tree and index)
+        records_file = self.review_manager.paths.RECORDS_FILE_GIT
+        main_recs_changed = records_file in [
+            item.a_path for item in self._git_repo.index.diff(None, paths=records_file)
+        ] + [x.a_path for x in self._git_repo.head.commit.diff(paths=records_file)]
         return main_recs_changed
 
     # pylint: disable=too-many-arguments
@@ -501,9 +530,12 @@ class Dataset:
 
     def file_in_history(self, filepath: Path) -> bool:
         """Check whether a file is in the git history"""
-        return str(filepath) in [
-            o.path for o in self._git_repo.head.commit.tree.traverse()
-        ]
+        # Look up the path in the tree instead of traversing the whole tree
+        try:
+            self._git_repo.head.commit.tree.join(str(filepath))
+        except KeyError:
+            return False
+        return True
 
     def get_commit_message(self, *, commit_nr: int) -> str:
         """Get the commit message for commit #"""
@@ -551,58 +583,60 @@ class Dataset:
         tree_hash = self._git_repo.git.execute(["git", "write-tree"])
         return str(tree_hash)
 
-    def _get_remote_commit_differences(self) -> list:  # pragma: no cover
+    def _fetch_recently(self) -> bool:  # pragma: no cover
+        # git updates FETCH_HEAD on each fetch
+        fetch_head = Path(self._git_repo.git_dir) / Path("FETCH_HEAD")
+        try:
+            return time.time() - fetch_head.stat().st_mtime < FETCH_INTERVAL
+        except FileNotFoundError:
+            return False
+
+    def get_remote_commit_differences(self) -> list:  # pragma: no cover
+        """Get the number of commits behind and ahead of the remote"""
         origin = self._git_repo.remotes.origin
-        if origin.exists():
+        if not origin.exists():
+            return [-1, -1]
+        tracking_branch = self._git_repo.active_branch.tracking_branch()
+        if tracking_branch is None:
+            return [-1, -1]
+        if not self._fetch_recently():
             try:
-                origin.fetch()
+                # Only the tracking branch is needed (instead of all refs)
+                origin.fetch(tracking_branch.remote_head)
             except GitCommandError:
                 return [-1, -1]
 
-        nr_commits_behind, nr_commits_ahead = -1, -1
-        if self._git_repo.active_branch.tracking_branch() is not None:
+        # The differences only change when one of the branches moves
+        cache_key = (
+            self._git_repo.head.commit.hexsha,
+            tracking_branch.commit.hexsha,
+        )
+        if cache_key not in self._remote_commit_differences_cache:
             branch_name = str(self._git_repo.active_branch)
-            tracking_branch_name = str(self._git_repo.active_branch.tracking_branch())
-            # self.review_manager.logger.debug(f"{branch_name} - {tracking_branch_name}")
-
-            behind_operation = branch_name + ".." + tracking_branch_name
-            commits_behind = self._git_repo.iter_commits(behind_operation)
-            nr_commits_behind = sum(1 for c in commits_behind)
-
-            ahead_operation = tracking_branch_name + ".." + branch_name
-            commits_ahead = self._git_repo.iter_commits(ahead_operation)
-            nr_commits_ahead = sum(1 for c in commits_ahead)
+            # Count both directions in a single call
+            # (left: commits only in the tracking branch, right: only in the branch)
+            self._remote_commit_differences_cache[cache_key] = [
+                int(x)
+                for x in self._git_repo.git.rev_list(
+                    "--left-right", "--count", f"{tracking_branch}...{branch_name}"
+                ).split()
+            ]
 
-        return [nr_commits_behind, nr_commits_ahead]
+        return list(self._remote_commit_differences_cache[cache_key])
 
     def behind_remote(self) -> bool:  # pragma: no cover
         """Check whether the repository is behind the remote"""
-        nr_commits_behind = 0
-        connected_remote = 0 != len(self._git_repo.remotes)
-        if connected_remote:
-            origin = self._git_repo.remotes.origin
-            if origin.exists():
-                (
-                    nr_commits_behind,
-                    _,
-                ) = self._get_remote_commit_differences()
-        if nr_commits_behind > 0:
-            return True
-        return False
+        if 0 == len(self._git_repo.remotes):
+            return False
+        nr_commits_behind, _ = self.get_remote_commit_differences()
+        return nr_commits_behind > 0
 
     def remote_ahead(self) -> bool:  # pragma: no cover
         """Check whether the remote is ahead"""
-        connected_remote = 0 != len(self._git_repo.remotes)
-        if connected_remote:
-            origin = self._git_repo.remotes.origin
-            if origin.exists():
-                (
-                    _,
-                    nr_commits_ahead,
-                ) = self._get_remote_commit_differences()
-                if nr_commits_ahead > 0:
-                    return True
-        return False
+        if 0 == len(self._git_repo.remotes):
+            return False
+        _, nr_commits_ahead = self.get_remote_commit_differences()
+        return nr_commits_ahead > 0
 
     def pull_if_repo_clean(self) -> None:  # pragma: no cover
         """Pull project if repository is clean"""
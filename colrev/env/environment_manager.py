@@ -10,6 +10,7 @@ from pathlib import Path
 import git
 import yaml
 
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.ops.check
 import colrev.process.operation
@@ -148,7 +149,7 @@ class EnvironmentManager:
         status_yml = review_manager.paths.status
         with open(status_yml, encoding="utf8") as stream:
             try:
-                status_dict = yaml.safe_load(stream)
+                status_dict = colrev.env.utils.load_yaml(stream)
             except yaml.YAMLError as exc:  # pragma: no cover
                 print(exc)
         return status_dict
@@ -37,7 +37,7 @@ class GrobidService:
         i = 0
         while True:
             i += 1
-            time.sleep(1)
+            # Check first (and only wait before retrying)
             try:
                 ret = requests.get(self.GROBID_URL + "/api/isalive", timeout=30)
                 if ret.text == "true":
@@ -46,11 +46,9 @@ class GrobidService:
                 pass
             if not wait:
                 return False
-            if i == -1:
-                break
             if i > 20:
                 raise requests.exceptions.ConnectionError()
-        return True
+            time.sleep(1)
 
     def start(
         self,
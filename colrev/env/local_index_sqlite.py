@@ -2,6 +2,7 @@
 """LocalIndex: sqlite."""
 from __future__ import annotations
 
+import re
 import sqlite3
 import typing
 
@@ -13,6 +14,8 @@ from colrev.constants import Fields
 from colrev.constants import Filepaths
 from colrev.constants import LocalIndexFields
 
+BIBTEX_ID_RE = re.compile(r"^@\w+\{([^,]+),")
+
 # Note : records are indexed by id = hash(colrev_id)
 # to ensure that the indexing-ids do not exceed limits
 # such as the opensearch limit of 512 bytes.
@@ -95,6 +98,34 @@ class SQLiteIndex:
         retrieved_record = list(records_dict.values())[0]
         return retrieved_record
 
+    def _load_rows_at_once(self, rows: list) -> typing.Optional[list]:
+        # Parse the records of all rows at once (instead of one load per row)
+        # if the IDs are unique (the bib loader would change duplicate IDs)
+        row_ids = []
+        for row in rows:
+            match = BIBTEX_ID_RE.match(row[LocalIndexFields.BIBTEX].lstrip())
+            if not match:
+                return None
+            row_ids.append(match.group(1).strip())
+
+        if len(rows) < 2 or len(set(row_ids)) != len(row_ids):
+            return None
+
+        records_dict = colrev.loader.load_utils.loads(
+            load_string="\n".join(row[LocalIndexFields.BIBTEX] for row in rows),
+            implementation="bib",
+            unique_id_field="ID",
+        )
+        if not all(row_id in records_dict for row_id in row_ids):
+            return None
+        return [records_dict[row_id] for row_id in row_ids]
+
+    def _get_records_from_rows(self, rows: list) -> list:
+        records = self._load_rows_at_once(rows)
+        if records is None:
+            return [self._get_record_from_row(row) for row in rows]
+        return records
+
 
 class SQLiteIndexRecord(SQLiteIndex):
     """The SQLiteIndexRecord class implements indexing and retrieval of records locally"""
@@ -238,15 +269,8 @@ class SQLiteIndexRecord(SQLiteIndex):
     def search(self, query: str) -> list:
         """Search for records in the index"""
         cur = self._get_cursor()
-        records_to_return = []
-
-        selected_row = None
         cur.execute(f"{self.SELECT_ALL_QUERY} {query}")
-        for row in cur.fetchall():
-            selected_row = row
-            retrieved_record_dict = self._get_record_from_row(selected_row)
-            records_to_return.append(retrieved_record_dict)
-        return records_to_return
+        return self._get_records_from_rows(cur.fetchall())
 
 
 class SQLiteIndexRankings(SQLiteIndex):
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Collection of utility functions"""
+import hashlib
 import operator
 import pkgutil
 import re
+import time
 import typing
 import unicodedata
 from enum import Enum
@@ -10,12 +12,17 @@ from functools import reduce
 from pathlib import Path
 from pathlib import PosixPath
 
+import yaml
 from jinja2 import Environment
 from jinja2 import FunctionLoader
 from jinja2.environment import Template
 
 import colrev.exceptions as colrev_exceptions
 
+# Files modified within this window can be modified again without changing
+# their modification time (due to the timestamp granularity of file systems)
+RACY_TIMESTAMP_WINDOW_NS = 2_000_000_000
+
 
 def retrieve_package_file(*, template_file: Path, target: Path) -> None:
     """Retrieve a file from the CoLRev package"""
@@ -38,6 +45,30 @@ def get_package_file_content(
     return pkgutil.get_data(module, str(filename))
 
 
+def load_yaml(stream: typing.Union[str, bytes, typing.IO]) -> typing.Any:
+    """Load a YAML document (with the libyaml-based loader if available)"""
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def get_file_signature(path: Path) -> tuple:
+    """Get a signature of the file (to detect changes without reading it)
+
+    Like the git index, the signature consists of the inode, the modification
+    time and the size. For recently modified ("racy") files, it also contains
+    a digest of the content because in-place writes (e.g., by editors or git)
+    may not change the modification time. Missing files have no signature.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return ()
+    signature: tuple = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    if time.time_ns() - stat.st_mtime_ns < RACY_TIMESTAMP_WINDOW_NS:
+        digest = hashlib.sha1(path.read_bytes(), usedforsecurity=False).hexdigest()
+        signature += (digest,)
+    return signature
+
+
 def inplace_change(*, filename: Path, old_string: str, new_string: str) -> None:
     """Replace a string in a file"""
     with open(filename, encoding="utf8") as file:
@@ -51,10 +82,9 @@ def inplace_change(*, filename: Path, old_string: str, new_string: str) -> None:
 
 def get_template(template_path: str) -> Template:
     """Load a jinja template"""
-    environment = Environment(
-        loader=FunctionLoader(_load_jinja_template), autoescape=True
-    )
-    template = environment.get_template(template_path)
+    # The shared environment caches compiled templates
+    # (e.g., the status report, which is rendered for each commit)
+    template = _JINJA_ENVIRONMENT.get_template(template_path)
     return template
 
 
@@ -72,6 +102,11 @@ def _load_jinja_template(template_path: str) -> str:
     raise colrev_exceptions.TemplateNotAvailableError(template_path)
 
 
+_JINJA_ENVIRONMENT = Environment(
+    loader=FunctionLoader(_load_jinja_template), autoescape=True
+)
+
+
 def remove_accents(input_str: str) -> str:
     """Replace the accents in a string"""
 
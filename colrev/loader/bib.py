@@ -5,7 +5,7 @@ from __future__ import annotations
 import io
 import itertools
 import logging
-import os
+import mmap
 import re
 import string
 import typing
@@ -26,6 +26,20 @@ from colrev.constants import RecordState
 # pylint: disable=too-few-public-methods
 # pylint: disable=too-many-arguments
 
+# Patterns of the fixes applied to each line before loading
+KEY_WITH_SPACE_RE = re.compile(r"^\s*[a-zA-Z0-9]+\s+[a-zA-Z0-9]+\s*\=")
+KEY_WITH_SPACE_SUB_RE = re.compile(r"(^\s*)([a-zA-Z0-9]+)\s+([a-zA-Z0-9]+)(\s*\=)")
+ID_WITH_SPACE_RE = re.compile(r"^@[a-zA-Z0-9]+\{[a-zA-Z0-9]+\s[a-zA-Z0-9]+,")
+ID_WITH_SPACE_SUB_RE = re.compile(r"^(@[a-zA-Z0-9]+\{[a-zA-Z0-9]+)\s([a-zA-Z0-9]+,)")
+# Record headers (lines starting with @, except @comment)
+# Note: the first line may start with a UTF-8 byte order mark
+RECORD_HEADER_RE = re.compile(
+    rb"^(?:\xef\xbb\xbf)?@(?!comment)", re.MULTILINE | re.IGNORECASE
+)
+
+# Larger read buffer for line-oriented scans of (large) bib files
+READ_BUFFER_SIZE = 1024 * 1024
+
 
 class BIBLoader(colrev.loader.loader.Loader):
     """Loads BibTeX files"""
@@ -53,12 +67,13 @@ class BIBLoader(colrev.loader.loader.Loader):
     @classmethod
     def get_nr_records(cls, filename: Path) -> int:
         """Get the number of records in the file"""
-        count = 0
-        with open(filename, encoding="utf8") as file:
-            for line in file:
-                if line.startswith("@") and "@comment" not in line[:10].lower():
-                    count += 1
-        return count
+        if Path(filename).stat().st_size == 0:
+            return 0
+        with open(filename, "rb") as file:
+            # Count the record headers in the memory-mapped file
+            # (instead of decoding and iterating over each line)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return sum(1 for _ in RECORD_HEADER_RE.finditer(mapped))
 
     def _generate_next_unique_id(
         self,
@@ -95,8 +110,6 @@ class BIBLoader(colrev.loader.loader.Loader):
             file.seek(seekpos)
             file.write(replacement_line)
             seekpos = file.tell()
-            file.flush()
-            os.fsync(file)
             file.write(remaining)
             file.truncate()  # if the replacement is shorter...
             file.seek(seekpos)
@@ -152,8 +165,6 @@ class BIBLoader(colrev.loader.loader.Loader):
                             file.seek(seekpos)
                             file.write(replacement_line)
                             seekpos = file.tell()
-                            file.flush()
-                            os.fsync(file)
                             file.write(remaining)
                             file.truncate()  # if the replacement is shorter...
                             file.seek(seekpos)
@@ -163,26 +174,18 @@ class BIBLoader(colrev.loader.loader.Loader):
                         else:
                             record_ids.append(current_id_str)
 
+                    line_str = line.decode("utf-8")
                     # Fix keys
-                    if re.match(
-                        r"^\s*[a-zA-Z0-9]+\s+[a-zA-Z0-9]+\s*\=", line.decode("utf-8")
-                    ):
-                        replacement_line = re.sub(
-                            r"(^\s*)([a-zA-Z0-9]+)\s+([a-zA-Z0-9]+)(\s*\=)",
-                            r"\1\2_\3\4",
-                            line.decode("utf-8"),
+                    if KEY_WITH_SPACE_RE.match(line_str):
+                        replacement_line = KEY_WITH_SPACE_SUB_RE.sub(
+                            r"\1\2_\3\4", line_str
                         ).encode("utf-8")
                         seekpos = fix_key(file, line, replacement_line, seekpos)
 
                     # Fix IDs
-                    if re.match(
-                        r"^@[a-zA-Z0-9]+\{[a-zA-Z0-9]+\s[a-zA-Z0-9]+,",
-                        line.decode("utf-8"),
-                    ):
-                        replacement_line = re.sub(
-                            r"^(@[a-zA-Z0-9]+\{[a-zA-Z0-9]+)\s([a-zA-Z0-9]+,)",
-                            r"\1_\2",
-                            line.decode("utf-8"),
+                    if ID_WITH_SPACE_RE.match(line_str):
+                        replacement_line = ID_WITH_SPACE_SUB_RE.sub(
+                            r"\1_\2", line_str
                         ).encode("utf-8")
                         seekpos = fix_key(file, line, replacement_line, seekpos)
 
@@ -211,61 +214,37 @@ class BIBLoader(colrev.loader.loader.Loader):
                 name_string += join([first, middle])
             return name_string
 
-        # Need to concatenate fields and persons dicts
-        # but pybtex is still the most efficient solution.
-        records_dict = {
-            k: {
-                **{Fields.ID: k},
-                **{Fields.ENTRYTYPE: v.type},
-                **dict(
-                    {
-                        # Cast status to Enum
-                        k: (
-                            RecordState[v]
-                            if (Fields.STATUS == k)
-                            # DOIs are case insensitive -> use upper case.
-                            else (
-                                v.upper()
-                                if (Fields.DOI == k)
-                                # Note : the following two lines are a temporary fix
-                                # to converg colrev_origins to list items
-                                else (
-                                    [
-                                        el.rstrip().lstrip()
-                                        for el in v.split(";")
-                                        if "" != el
-                                    ]
-                                    if k == Fields.ORIGIN
-                                    else (
-                                        [
-                                            el.rstrip()
-                                            for el in (v + " ").split("; ")
-                                            if "" != el
-                                        ]
-                                        if k in FieldSet.LIST_FIELDS
-                                        else (
-                                            self._load_field_dict(value=v, field=k)
-                                            if k in [Fields.MD_PROV, Fields.D_PROV]
-                                            else v
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                        for k, v in v.fields.items()
-                    }
-                ),
-                **dict(
-                    {
-                        k: " and ".join(format_name(person) for person in persons)
-                        for k, persons in v.persons.items()
-                    }
-                ),
-            }
-            for k, v in records_dict.items()
-        }
-
-        return records_dict
+        # Build each record in a single pass over the pybtex fields and persons
+        # (pybtex is still the most efficient solution).
+        parsed_records_dict = {}
+        for record_id, entry in records_dict.items():
+            record_dict = {Fields.ID: record_id, Fields.ENTRYTYPE: entry.type}
+            for key, value in entry.fields.items():
+                record_dict[key] = self._parse_field_value(key=key, value=value)
+            for key, persons in entry.persons.items():
+                record_dict[key] = " and ".join(
+                    format_name(person) for person in persons
+                )
+            parsed_records_dict[record_id] = record_dict
+
+        return parsed_records_dict
+
+    def _parse_field_value(self, *, key: str, value: str) -> typing.Any:
+        # Cast status to Enum
+        if key == Fields.STATUS:
+            return RecordState[value]
+        # DOIs are case insensitive -> use upper case.
+        if key == Fields.DOI:
+            return value.upper()
+        # Note : the following two lines are a temporary fix
+        # to converg colrev_origins to list items
+        if key == Fields.ORIGIN:
+            return [el.rstrip().lstrip() for el in value.split(";") if "" != el]
+        if key in FieldSet.LIST_FIELDS:
+            return [el.rstrip() for el in (value + " ").split("; ") if "" != el]
+        if key in [Fields.MD_PROV, Fields.D_PROV]:
+            return self._load_field_dict(value=value, field=key)
+        return value
 
     def _load_field_dict(self, *, value: str, field: str) -> dict:
         # pylint: disable=too-many-branches
@@ -324,38 +303,33 @@ class BIBLoader(colrev.loader.loader.Loader):
 
         return return_dict
 
-    def _parse_k_v(self, item_string: str) -> tuple:
-        if " = " in item_string:
-            key, value = item_string.split(" = ", 1)
-        else:
-            key = Fields.ID
-            value = item_string.split("{")[1]
-
-        key = key.lstrip().rstrip()
-        value = value.lstrip().rstrip().lstrip("{").rstrip("},")
+    def _parse_header_value(self, *, key: str, value: str) -> typing.Any:
+        value = value.strip().lstrip("{").rstrip("},")
         if key == Fields.ORIGIN:
             value_list = value.replace("\n", "").split(";")
-            value_list = [x.lstrip(" ").rstrip(" ") for x in value_list if x]
-            return key, value_list
+            return [x.strip(" ") for x in value_list if x]
         if key == Fields.STATUS:
-            return key, RecordState[value]
+            return RecordState[value]
         if key == Fields.MD_PROV:
-            return key, self._load_field_dict(value=value, field=key)
+            return self._load_field_dict(value=value, field=key)
         if key == Fields.FILE:
-            return key, Path(value)
+            return Path(value)
 
-        return key, value
+        return value
 
     # pylint: disable=too-many-branches
     def _read_record_header_items(
         self, *, file_object: typing.Optional[typing.TextIO] = None
-    ) -> list:
+    ) -> typing.Iterator[dict]:
         # Note : more than 10x faster than the pybtex part of load_records_dict()
 
         if file_object is None:
             assert self.filename is not None
-            # pylint: disable=consider-using-with
-            file_object = open(self.filename, encoding="utf-8")
+            with open(
+                self.filename, encoding="utf-8", buffering=READ_BUFFER_SIZE
+            ) as file:
+                yield from self._read_record_header_items(file_object=file)
+            return
 
         # Fields required
         default = {
@@ -368,18 +342,13 @@ class BIBLoader(colrev.loader.loader.Loader):
         }
         # number_required_header_items = len(default)
 
-        record_header_item = default.copy()
-        item_count, item_string, record_header_items = (
-            0,
-            "",
-            [],
-        )
-        while True:
-            line = file_object.readline()
-            if not line:
-                break
+        def drop_missing(record_header_item: dict) -> dict:
+            return {k: v for k, v in record_header_item.items() if "NA" != v}
 
-            if line[:1] == "%" or line == "\n":
+        record_header_item = default.copy()
+        item_count, item_string = 0, ""
+        for line in file_object:
+            if line.startswith("%") or line == "\n":
                 continue
 
             # if item_count > number_required_header_items or "}" == line:
@@ -389,39 +358,40 @@ class BIBLoader(colrev.loader.loader.Loader):
             #     continue
 
             if "@" in line[:2] and record_header_item[Fields.ID] != "NA":
-                record_header_items.append(record_header_item)
+                yield drop_missing(record_header_item)
                 record_header_item = default.copy()
                 item_count = 0
 
             item_string += line
             if "}," in line or "@" in line[:2]:
-                key, value = self._parse_k_v(item_string)
-                # if key == Fields.MD_PROV:
-                #     if value == "NA":
-                #         value = {}
-                # if value == "NA":
-                #     item_string = ""
-                #     continue
-                item_string = ""
+                # Only parse the values of header items
+                # (skip copying/stripping long values, such as abstracts)
+                # Split key and value once and dispatch on the key
+                key_end = item_string.find(" = ")
+                if key_end != -1:
+                    key = item_string[:key_end].strip()
+                    value = item_string[key_end + 3 :]
+                else:
+                    key = Fields.ID
+                    value = item_string.split("{", 2)[1]
                 if key in record_header_item:
                     item_count += 1
-                    record_header_item[key] = value
+                    record_header_item[key] = self._parse_header_value(
+                        key=key, value=value
+                    )
+                item_string = ""
 
         if record_header_item[Fields.ORIGIN] != "NA":
-            record_header_items.append(record_header_item)
-
-        return [
-            {k: v for k, v in record_header_item.items() if "NA" != v}
-            for record_header_item in record_header_items
-        ]
-
-    def get_record_header_items(self) -> dict:
-        """Get the record header items"""
-        record_header_list = []
-        record_header_list = self._read_record_header_items()
+            yield drop_missing(record_header_item)
 
-        record_header_dict = {r[Fields.ID]: r for r in record_header_list}
-        return record_header_dict
+    def get_record_header_items(
+        self, *, file_object: typing.Optional[typing.TextIO] = None
+    ) -> dict:
+        """Get the record header items (from the file or the file_object)"""
+        return {
+            r[Fields.ID]: r
+            for r in self._read_record_header_items(file_object=file_object)
+        }
 
     def load_records_list(self) -> list:
 
@@ -143,6 +143,9 @@ import colrev.loader.ris
 import colrev.loader.table
 
 
+# Record counts per file, keyed by path: (st_mtime_ns, st_size, nr_records)
+_NR_RECORDS_CACHE: typing.Dict[str, typing.Tuple[int, int, int]] = {}
+
 # pylint: disable=too-many-arguments
 # flake8: noqa: E501
 
@@ -237,9 +240,17 @@ def get_nr_records(  # type: ignore
 ) -> int:
     """Get the number of records in a file"""
 
-    if not filename.exists():
+    try:
+        stat = filename.stat()
+    except FileNotFoundError:
         return 0
 
+    # Files are only counted again when they changed
+    cache_key = str(filename.resolve())
+    cached = _NR_RECORDS_CACHE.get(cache_key)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
     if filename.suffix == ".bib":
         parser = colrev.loader.bib.BIBLoader  # type: ignore
     elif filename.suffix in [".csv", ".xls", ".xlsx"]:
@@ -257,4 +268,6 @@ def get_nr_records(  # type: ignore
     else:
         raise NotImplementedError
 
-    return parser.get_nr_records(filename)
+    nr_records = parser.get_nr_records(filename)
+    _NR_RECORDS_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, nr_records)
+    return nr_records
@@ -33,6 +33,18 @@ class Loader:
 
         self.logger = logger
 
+    @classmethod
+    def _count_lines_starting_with(cls, filename: Path, prefix: bytes) -> int:
+        """Count the lines starting with the prefix"""
+        # Count the byte sequences (instead of decoding and iterating over each line)
+        # Note: "\r\n" line endings contain "\n", "\r" line endings do not
+        data = filename.read_bytes()
+        return (
+            data.startswith(prefix)
+            + data.count(b"\n" + prefix)
+            + data.count(b"\r" + prefix)
+        )
+
     def _set_ids(self, records_list: list) -> None:
         if self.unique_id_field == "INCREMENTAL":
             for next_id, record_dict in enumerate(records_list, 1):
@@ -54,12 +54,7 @@ class RISLoader(colrev.loader.loader.Loader):
     @classmethod
     def get_nr_records(cls, filename: Path) -> int:
         """Get the number of records in the file"""
-        count = 0
-        with open(filename, encoding="utf-8") as file:
-            for line in file:
-                if line.startswith("TY "):
-                    count += 1
-        return count
+        return cls._count_lines_starting_with(filename, b"TY ")
 
     def _get_tag(self, line: str) -> str:
         """Get the tag from a line in the RIS file."""
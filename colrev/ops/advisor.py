@@ -49,7 +49,8 @@ class Advisor:
         self.review_manager = review_manager
         colrev.ops.check.CheckOperation(self.review_manager)
         self.records = self.review_manager.dataset.load_records_dict()
-        self.status_stats = review_manager.get_status_stats(records=self.records)
+        # Reuses the status stats if they were computed for the current records
+        self.status_stats = review_manager.get_status_stats()
         self.environment_manager = self.review_manager.get_environment_manager()
 
     def _append_merge_conflict_warning(
@@ -78,10 +79,11 @@ class Advisor:
         # Notify when changes in bib files are not staged
         # (this may raise unexpected errors)
 
+        # Limit the diff to bib files (instead of diffing the whole working tree)
         non_staged = [
             item.a_path
-            for item in git_repo.index.diff(None)
-            if item.a_path[-4:] == ".bib"
+            for item in git_repo.index.diff(None, paths=["*.bib"])
+            if item.a_path.endswith(".bib")
         ]
         if len(non_staged) > 0:
             item = {
@@ -99,7 +101,14 @@ class Advisor:
         share_stat_req = self.review_manager.settings.project.share_stat_req
         collaboration_instructions["SHARE_STAT_REQ"] = share_stat_req
 
-        if self.review_manager.dataset.behind_remote():
+        # Determine both differences at once
+        # (instead of calling behind_remote() and remote_ahead())
+        (
+            nr_commits_behind,
+            nr_commits_ahead,
+        ) = self.review_manager.dataset.get_remote_commit_differences()
+
+        if nr_commits_behind > 0:
             item = {
                 "title": "Remote changes available on the server",
                 "level": "WARNING",
@@ -110,7 +119,7 @@ class Advisor:
             }
             collaboration_instructions["items"].append(item)
 
-        if self.review_manager.dataset.remote_ahead():
+        if nr_commits_ahead > 0:
             item = {
                 "title": "Local changes not yet on the server",
                 "level": "WARNING",
@@ -238,8 +247,9 @@ class Advisor:
         return collaboration_instructions
 
     def _append_initial_load_instruction(self, review_instructions: list) -> None:
-        current_origin_states_dict = self.review_manager.dataset.get_origin_state_dict()
-        if len(current_origin_states_dict) == 0:
+        # The status stats already contain the origin states
+        # (instead of reading the records file again)
+        if len(self.status_stats.origin_states_dict) == 0:
             instruction = {
                 "msg": "To import, copy search results to the search directory.",
                 "cmd": "colrev load",
@@ -509,13 +519,16 @@ class Advisor:
             branch_name = str(git_repo.active_branch)
             tracking_branch_name = str(git_repo.active_branch.tracking_branch())
 
-            behind_operation = branch_name + ".." + tracking_branch_name
-            commits_behind = git_repo.iter_commits(behind_operation)
-            nr_commits_behind = sum(1 for c in commits_behind)
-
-            ahead_operation = tracking_branch_name + ".." + branch_name
-            commits_ahead = git_repo.iter_commits(ahead_operation)
-            nr_commits_ahead = sum(1 for c in commits_ahead)
+            # Count both directions in a single call
+            # (instead of iterating over the commits in each range)
+            nr_commits_behind, nr_commits_ahead = (
+                int(x)
+                for x in git_repo.git.rev_list(
+                    "--left-right",
+                    "--count",
+                    f"{tracking_branch_name}...{branch_name}",
+                ).split()
+            )
 
             # Note: do not use named arguments (multiprocessing)
             if not Path(registered_path).is_dir():
@@ -544,15 +557,13 @@ class Advisor:
         return instruction
 
     def _extract_outlet_count(self) -> typing.Tuple[list, list]:
-        with open(self.review_manager.paths.records, encoding="utf8") as file:
-            outlets = []
-            for line in file.readlines():
-                if line.lstrip()[:8] == "journal ":
-                    journal = line[line.find("{") + 1 : line.rfind("}")]
-                    outlets.append(journal)
-                if line.lstrip()[:10] == "booktitle ":
-                    booktitle = line[line.find("{") + 1 : line.rfind("}")]
-                    outlets.append(booktitle)
+        # Use the records loaded in __init__ (instead of scanning the records file)
+        outlets = [
+            record_dict[key]
+            for record_dict in self.records.values()
+            for key in [Fields.JOURNAL, Fields.BOOKTITLE]
+            if key in record_dict
+        ]
 
         outlet_counter: typing.List[typing.Tuple[str, int]] = [
             (j, x) for j, x in Counter(outlets).most_common(10) if x > 5
@@ -620,7 +631,7 @@ class Advisor:
         environment_instructions += list(filter(None, add_instructions))
 
         corrections_path = self.review_manager.paths.corrections
-        if len(list(corrections_path.glob("*.json"))) > 0:
+        if any(corrections_path.glob("*.json")):
             instruction = {
                 "msg": "Corrections to share with curated repositories.",
                 "cmd": "colrev push -r",
@@ -9,19 +9,31 @@ import typing
 from importlib.metadata import version
 from pathlib import Path
 
-import yaml
 from git.exc import InvalidGitRepositoryError
 
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
 from colrev.constants import OperationsType
 from colrev.constants import RecordState
-from colrev.process.model import ProcessModel
+from colrev.process.model import TRANSITION_TRIGGERS
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.review_manager
 
+POST_MD_PROCESSED_STATES = frozenset(
+    RecordState.get_post_x_states(state=RecordState.md_processed)
+)
+POST_REV_INCLUDED_STATES = frozenset(
+    RecordState.get_post_x_states(state=RecordState.rev_included)
+)
+
+BIB_ID_RE = re.compile(rb"^[ \t]*@\w+\s*\{\s*([^,\n]+?)\s*,", re.MULTILINE)
+
+# Installed hooks per pre-commit config: path -> (st_mtime_ns, st_size, hooks)
+_INSTALLED_HOOKS_CACHE: typing.Dict[str, typing.Tuple[int, int, list]] = {}
+
 
 class Checker:
     """The CoLRev checker makes sure the project setup is ok"""
@@ -35,6 +47,10 @@ class Checker:
     ) -> None:
         self.review_manager = review_manager
         self.review_manager.notified_next_operation = OperationsType.check
+        # IDs per bib file, keyed by path and validated by (mtime, size)
+        self._bib_ids_cache: typing.Dict[
+            Path, typing.Tuple[typing.Tuple[float, int], list]
+        ] = {}
 
     def get_colrev_versions(self) -> list[str]:
         """Get the colrev version as a list: (last_version, current_version)"""
@@ -121,15 +137,34 @@ class Checker:
         return True
 
     def _get_installed_hooks(self) -> list:
+        # The pre-commit config rarely changes: parse it only when it was modified
+        pre_commit_config_path = self.review_manager.paths.pre_commit_config
+        stat = pre_commit_config_path.stat()
+        cached = _INSTALLED_HOOKS_CACHE.get(str(pre_commit_config_path))
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return list(cached[2])
+
         installed_hooks = []
-        with open(
-            self.review_manager.paths.pre_commit_config, encoding="utf8"
-        ) as pre_commit_y:
-            pre_commit_config = yaml.load(pre_commit_y, Loader=yaml.SafeLoader)
+        with open(pre_commit_config_path, encoding="utf8") as pre_commit_y:
+            pre_commit_config = colrev.env.utils.load_yaml(pre_commit_y)
         for repository in pre_commit_config["repos"]:
             installed_hooks.extend([hook["id"] for hook in repository["hooks"]])
+        _INSTALLED_HOOKS_CACHE[str(pre_commit_config_path)] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            list(installed_hooks),
+        )
         return installed_hooks
 
+    @classmethod
+    def _is_generated_by_pre_commit(cls, hook_file: Path) -> bool:
+        # Open directly (instead of checking is_file() first)
+        try:
+            with open(hook_file, encoding="utf8") as file:
+                return "File generated by pre-commit" in file.read(4096)
+        except (FileNotFoundError, IsADirectoryError):
+            return False
+
     def _require_colrev_hooks_installed(self) -> bool:
         required_hooks = [
             "colrev-hooks-check",
@@ -138,66 +173,48 @@ class Checker:
             "colrev-hooks-share",
         ]
         installed_hooks = self._get_installed_hooks()
-        hooks_activated = set(required_hooks).issubset(set(installed_hooks))
-        if not hooks_activated:
-            missing_hooks = [x for x in required_hooks if x not in installed_hooks]
+        missing_hooks = [x for x in required_hooks if x not in installed_hooks]
+        if missing_hooks:
             raise colrev_exceptions.RepoSetupError(
                 f"missing hooks in .pre-commit-config.yaml ({', '.join(missing_hooks)})"
             )
 
         if not self.review_manager.in_ci_environment():
-            pch_file = Path(".git/hooks/pre-commit")
-            if pch_file.is_file():
-                with open(pch_file, encoding="utf8") as file:
-                    if "File generated by pre-commit" not in file.read(4096):
-                        raise colrev_exceptions.RepoSetupError(
-                            "pre-commit hooks not installed (use pre-commit install)"
-                        )
-            else:
-                raise colrev_exceptions.RepoSetupError(
-                    "pre-commit hooks not installed (use pre-commit install)"
-                )
-
-            psh_file = Path(".git/hooks/pre-push")
-            if psh_file.is_file():
-                with open(psh_file, encoding="utf8") as file:
-                    if "File generated by pre-commit" not in file.read(4096):
-                        raise colrev_exceptions.RepoSetupError(
-                            "pre-commit push hooks not installed "
-                            "(use pre-commit install --hook-type pre-push)"
-                        )
-            else:
-                raise colrev_exceptions.RepoSetupError(
+            for hook_file, message in [
+                (
+                    Path(".git/hooks/pre-commit"),
+                    "pre-commit hooks not installed (use pre-commit install)",
+                ),
+                (
+                    Path(".git/hooks/pre-push"),
                     "pre-commit push hooks not installed "
-                    "(use pre-commit install --hook-type pre-push)"
-                )
-
-            pcmh_file = Path(".git/hooks/prepare-commit-msg")
-            if pcmh_file.is_file():
-                with open(pcmh_file, encoding="utf8") as file:
-                    if "File generated by pre-commit" not in file.read(4096):
-                        raise colrev_exceptions.RepoSetupError(
-                            "pre-commit prepare-commit-msg hooks not installed "
-                            "(use pre-commit install --hook-type prepare-commit-msg)"
-                        )
-            else:
-                raise colrev_exceptions.RepoSetupError(
+                    "(use pre-commit install --hook-type pre-push)",
+                ),
+                (
+                    Path(".git/hooks/prepare-commit-msg"),
                     "pre-commit prepare-commit-msg hooks not installed "
-                    "(use pre-commit install --hook-type prepare-commit-msg)"
-                )
+                    "(use pre-commit install --hook-type prepare-commit-msg)",
+                ),
+            ]:
+                if not self._is_generated_by_pre_commit(hook_file):
+                    raise colrev_exceptions.RepoSetupError(message)
 
         return True
 
     def _retrieve_ids_from_bib(self, *, file_path: Path) -> list:
         assert file_path.suffix == ".bib"
-        record_ids = []
-        with open(file_path, encoding="utf8") as file:
-            line = file.readline()
-            while line:
-                if "@" in line[:5]:
-                    record_id = line[line.find("{") + 1 : line.rfind(",")]
-                    record_ids.append(record_id.lstrip())
-                line = file.readline()
+        stat = file_path.stat()
+        file_signature = (stat.st_mtime, stat.st_size)
+        if file_path in self._bib_ids_cache:
+            cached_signature, cached_ids = self._bib_ids_cache[file_path]
+            if cached_signature == file_signature:
+                return cached_ids
+
+        record_ids = [
+            match.group(1).decode("utf-8")
+            for match in BIB_ID_RE.finditer(file_path.read_bytes())
+        ]
+        self._bib_ids_cache[file_path] = (file_signature, record_ids)
         return record_ids
 
     def _check_colrev_origins(self, *, status_data: dict) -> None:
@@ -214,25 +231,24 @@ class Checker:
         #     or self.review_manager.verbose_mode
         # ):
         #     # Check for broken origins
-        #     all_record_links = []
-        #     for bib_file in self.review_manager.search_dir.glob("*.bib"):
-        #         self.review_manager.logger.debug(bib_file)
-        #         search_ids = self._retrieve_ids_from_bib(file_path=bib_file)
-        #         for search_id in search_ids:
-        #             all_record_links.append(bib_file.name + "/" + search_id)
-        #     delta = set(status_data["record_links_in_bib"]) - set(all_record_links)
+        #     all_record_links = {
+        #         f"{bib_file.name}/{search_id}"
+        #         for bib_file in self.review_manager.search_dir.glob("*.bib")
+        #         for search_id in self._retrieve_ids_from_bib(file_path=bib_file)
+        #     }
+        #     delta = status_data["record_links_in_bib"] - all_record_links
         #     if len(delta) > 0:
         #         raise colrev_exceptions.OriginError(f"broken origins: {delta}")
 
         # Check for non-unique origins
-        non_unique_origins = []
-        for origin, record_ids in status_data["origin_ID_list"].items():
-            if len(record_ids) > 1:
-                if not origin.startswith("md_"):
-                    non_unique_origins.append(f"{origin} - {','.join(record_ids)}")
+        non_unique_origins = {
+            f"{origin} - {','.join(record_ids)}"
+            for origin, record_ids in status_data["origin_ID_list"].items()
+            if len(record_ids) > 1 and not origin.startswith("md_")
+        }
         if non_unique_origins:
             raise colrev_exceptions.OriginError(
-                f'Non-unique origins: {" , ".join(set(non_unique_origins))}'
+                f'Non-unique origins: {" , ".join(non_unique_origins)}'
             )
 
     def check_fields(self, *, status_data: dict) -> None:
@@ -275,13 +291,13 @@ class Checker:
         status: RecordState,
         screen_crit: str,
         field_errors: typing.List[str],
-        pattern: str,
-        pattern_inclusion: str,
+        pattern: re.Pattern,
+        pattern_inclusion: re.Pattern,
         criteria: typing.List[str],
     ) -> None:
         # No screening criteria allowed before screen
         if (
-            status not in RecordState.get_post_x_states(state=RecordState.rev_included)
+            status not in POST_REV_INCLUDED_STATES
             and status != RecordState.md_needs_manual_preparation
         ):
             if "NA" != screen_crit:
@@ -291,7 +307,7 @@ class Checker:
             return
 
         # All screening criteria must match pattern
-        if not re.match(pattern, screen_crit):
+        if not pattern.match(screen_crit):
             # Note: this should also catch cases of missing
             # screening criteria
             field_errors.append(
@@ -305,7 +321,7 @@ class Checker:
             RecordState.rev_included,
             RecordState.rev_synthesized,
         ]:
-            if not re.match(pattern_inclusion, screen_crit):
+            if not pattern_inclusion.match(screen_crit):
                 field_errors.append(
                     "Included record with screening_criterion satisfied: "
                     f"{record_id}, {status}, {screen_crit}"
@@ -337,13 +353,15 @@ class Checker:
         screening_criteria = self.review_manager.settings.screen.criteria
         if not screening_criteria:
             criteria = ["NA"]
-            pattern = "^NA$"
-            pattern_inclusion = "^NA$"
+            pattern = re.compile("^NA$")
+            pattern_inclusion = re.compile("^NA$")
         else:
-            pattern = (
+            pattern = re.compile(
                 "=(in|out|TODO);".join(screening_criteria.keys()) + "=(in|out|TODO)"
             )
-            pattern_inclusion = "=in;".join(screening_criteria.keys()) + "=in"
+            pattern_inclusion = re.compile(
+                "=in;".join(screening_criteria.keys()) + "=in"
+            )
             criteria = list(screening_criteria.keys())
 
         for [record_id, status, screen_crit] in status_data["screening_criteria_list"]:
@@ -392,19 +410,14 @@ class Checker:
                 if msg not in notifications:
                     notifications.append(msg)
         else:
-            with open(os.path.join(root, filename), encoding="utf8") as file:
-                line = file.readline()
-                while line:
-                    if filename.endswith(".bib") and "@" in line[:5]:
-                        line = file.readline()
-                    if prior_id in line:
-                        msg = (
-                            f"Old ID ({prior_id}, to {new_id} in "
-                            + f"the RECORDS_FILE) found in file: {filename}"
-                        )
-                        if msg not in notifications:
-                            notifications.append(msg)
-                    line = file.readline()
+            file_content = Path(os.path.join(root, filename)).read_bytes()
+            if prior_id.encode("utf-8") in file_content:
+                msg = (
+                    f"Old ID ({prior_id}, to {new_id} in "
+                    + f"the RECORDS_FILE) found in file: {filename}"
+                )
+                if msg not in notifications:
+                    notifications.append(msg)
 
     def check_change_in_propagated_id(
         self, *, prior_id: str, new_id: str = "TBD", project_context: Path
@@ -424,31 +437,45 @@ class Checker:
             "records.bib",
         ]
 
-        text_formats = [".txt", ".csv", ".md", ".bib", ".yaml"]
+        text_formats = (".txt", ".csv", ".md", ".bib", ".yaml")
         notifications: typing.List[str] = []
-        for root, dirs, files in os.walk(project_context, topdown=False):
-            for filename in files:
-                if any(
-                    (x in filename) or (x in root) for x in ignore_patterns
-                ) or not any(filename.endswith(x) for x in text_formats):
-                    # self.review_manager.logger.debug("Skipping %s", name)
-                    continue
-                self._check_change_in_propagated_id_in_file(
-                    notifications=notifications,
-                    root=root,
-                    filename=filename,
-                    prior_id=prior_id,
-                    new_id=new_id,
-                )
 
-            for dir_name in dirs:
-                if any((x in dir_name) or (x in root) for x in ignore_patterns):
-                    continue
-                if prior_id in dir_name:
-                    notifications.append(
-                        f"Old ID ({prior_id}, changed to {new_id} in the "
-                        f"RECORDS_FILE) found in filepath: {dir_name}"
-                    )
+        # Only consider files tracked by git (instead of walking all files,
+        # including untracked/ignored ones)
+        # Note: ls-files also lists files deleted from the working tree
+        git_repo = self.review_manager.dataset.get_repo()
+        tracked_files = [
+            Path(tracked_file)
+            for tracked_file in git_repo.git.ls_files("-z").split("\x00")
+            if tracked_file and (project_context / tracked_file).is_file()
+        ]
+        for tracked_file in tracked_files:
+            if not tracked_file.name.endswith(text_formats) or any(
+                x in tracked_file.as_posix() for x in ignore_patterns
+            ):
+                continue
+            self._check_change_in_propagated_id_in_file(
+                notifications=notifications,
+                root=str(project_context / tracked_file.parent),
+                filename=tracked_file.name,
+                prior_id=prior_id,
+                new_id=new_id,
+            )
+
+        tracked_dirs = {
+            parent
+            for tracked_file in tracked_files
+            for parent in tracked_file.parents
+            if parent != Path(".")
+        }
+        for tracked_dir in sorted(tracked_dirs):
+            if any(x in tracked_dir.as_posix() for x in ignore_patterns):
+                continue
+            if prior_id in tracked_dir.name:
+                notifications.append(
+                    f"Old ID ({prior_id}, changed to {new_id} in the "
+                    f"RECORDS_FILE) found in filepath: {tracked_dir.name}"
+                )
         return notifications
 
     def _check_change_in_propagated_ids(
@@ -484,16 +511,21 @@ class Checker:
                 )
 
     def _retrieve_prior(self) -> dict:
-        prior: dict = {Fields.STATUS: [], "persisted_IDs": []}
+        # prior[Fields.STATUS]: origin -> (position, status), indexed by origin
+        # to avoid scanning all prior origins for every record
+        prior: dict = {Fields.STATUS: {}, "persisted_IDs": []}
         prior_records = next(
-            self.review_manager.dataset.load_records_from_history(), {}
+            self.review_manager.dataset.load_records_from_history(header_only=True),
+            {},
         )
+        position = 0
         for prior_record in prior_records.values():
             for orig in prior_record[Fields.ORIGIN]:
-                prior[Fields.STATUS].append([orig, prior_record[Fields.STATUS]])
-                if prior_record[Fields.STATUS] in RecordState.get_post_x_states(
-                    state=RecordState.md_processed
-                ):
+                prior[Fields.STATUS].setdefault(
+                    orig, (position, prior_record[Fields.STATUS])
+                )
+                position += 1
+                if prior_record[Fields.STATUS] in POST_MD_PROCESSED_STATES:
                     prior["persisted_IDs"].append([orig, prior_record[Fields.ID]])
         return prior
 
@@ -510,7 +542,12 @@ class Checker:
         prior_status = []
         if Fields.STATUS in prior:
             prior_status = [
-                stat for (org, stat) in prior[Fields.STATUS] if org in origin
+                stat
+                for (_, stat) in sorted(
+                    prior[Fields.STATUS][org]
+                    for org in origin
+                    if org in prior[Fields.STATUS]
+                )
             ]
 
         status_transition = {}
@@ -518,12 +555,8 @@ class Checker:
             # pylint: disable=colrev-missed-constant-usage
             status_transition[record_id] = "load"
         else:
-            proc_transition_list: list = [
-                x["trigger"]
-                for x in ProcessModel.transitions
-                if str(x["source"]) == prior_status[0] and str(x["dest"]) == status
-            ]
-            if len(proc_transition_list) == 0 and prior_status[0] != status:
+            proc_transition = TRANSITION_TRIGGERS.get((prior_status[0], status))
+            if proc_transition is None and prior_status[0] != status:
                 status_data["start_states"].append(prior_status[0])
                 if prior_status[0] not in RecordState:
                     raise colrev_exceptions.StatusFieldValueError(
@@ -537,24 +570,22 @@ class Checker:
                 status_data["invalid_state_transitions"].append(
                     f"{record_id}: {prior_status[0]} to {status}"
                 )
-            if 0 == len(proc_transition_list):
+            if proc_transition is None:
                 # pylint: disable=colrev-missed-constant-usage
                 status_transition[record_id] = "load"
             else:
-                proc_transition = proc_transition_list.pop()
                 status_transition[record_id] = proc_transition
         return status_transition
 
     def _retrieve_status_data(self, *, prior: dict, records: dict) -> dict:
         status_data: dict = {
-            "pdf_not_exists": [],
             "status_fields": [],
             "status_transitions": [],
             "start_states": [],
             "screening_criteria_list": [],
             "IDs": [],
             "entries_without_origin": [],
-            "record_links_in_bib": [],
+            "record_links_in_bib": set(),
             "persisted_IDs": [],
             "origin_ID_list": {},
             "invalid_state_transitions": [],
@@ -564,27 +595,18 @@ class Checker:
             status_data["IDs"].append(record_dict[Fields.ID])
 
             for org in record_dict[Fields.ORIGIN]:
-                if org in status_data["origin_ID_list"]:
-                    status_data["origin_ID_list"][org].append(record_dict[Fields.ID])
-                else:
-                    status_data["origin_ID_list"][org] = [record_dict[Fields.ID]]
+                status_data["origin_ID_list"].setdefault(org, []).append(
+                    record_dict[Fields.ID]
+                )
 
-            post_md_processed_states = RecordState.get_post_x_states(
-                state=RecordState.md_processed
-            )
-            if record_dict[Fields.STATUS] in post_md_processed_states:
+            if record_dict[Fields.STATUS] in POST_MD_PROCESSED_STATES:
                 for origin_part in record_dict[Fields.ORIGIN]:
                     status_data["persisted_IDs"].append(
                         [origin_part, record_dict[Fields.ID]]
                     )
 
-            if Fields.FILE in record_dict:
-                if Path(record_dict[Fields.FILE]).is_file():
-                    status_data["pdf_not_exists"].append(record_dict[Fields.ID])
-
             if [] != record_dict.get(Fields.ORIGIN, []):
-                for org in record_dict[Fields.ORIGIN]:
-                    status_data["record_links_in_bib"].append(org)
+                status_data["record_links_in_bib"].update(record_dict[Fields.ORIGIN])
             else:
                 status_data["entries_without_origin"].append(record_dict[Fields.ID])
 
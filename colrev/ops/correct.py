@@ -20,7 +20,7 @@ class Corrections:
     """Handling corrections of metadata"""
 
     # pylint: disable=duplicate-code
-    essential_md_keys = [
+    essential_md_keys = (
         Fields.TITLE,
         Fields.AUTHOR,
         Fields.JOURNAL,
@@ -28,10 +28,9 @@ class Corrections:
         Fields.BOOKTITLE,
         Fields.NUMBER,
         Fields.VOLUME,
-        Fields.AUTHOR,
         Fields.DOI,
         Fields.ORIGIN,  # Note : for merges
-    ]
+    )
 
     keys_to_ignore = [
         Fields.ID,
@@ -60,11 +59,8 @@ class Corrections:
         self.corrections_path = self.review_manager.paths.corrections
         self.corrections_path.mkdir(exist_ok=True)
 
-    def _record_corrected(self, *, prior_r: dict, record_dict: dict) -> bool:
-        return not all(
-            prior_r.get(k, "NA") == record_dict.get(k, "NA")
-            for k in self.essential_md_keys
-        )
+    def _get_essential_md(self, record_dict: dict) -> tuple:
+        return tuple(record_dict.get(k, "NA") for k in self.essential_md_keys)
 
     def _prep_for_change_item_creation(
         self, *, original_record: dict, corrected_record: dict
@@ -183,23 +179,35 @@ class Corrections:
         prior_records_dict = next(
             self.review_manager.dataset.load_records_from_history(), {}
         )
+        # Index the prior records by origin (instead of scanning them per record)
+        # and extract their essential metadata once
+        prior_records_list = list(prior_records_dict.values())
+        prior_essential_md = [self._get_essential_md(r) for r in prior_records_list]
+        prior_positions_by_origin: typing.Dict[str, list] = {}
+        for position, prior_record in enumerate(prior_records_list):
+            for origin in prior_record[Fields.ORIGIN]:
+                prior_positions_by_origin.setdefault(origin, []).append(position)
+
         for record_dict in records.values():
             # identify curated records for which essential metadata is changed
-            record_prior = [
-                x
-                for x in prior_records_dict.values()
-                if any(y in record_dict[Fields.ORIGIN] for y in x[Fields.ORIGIN])
-            ]
-
-            if len(record_prior) == 0:
+            prior_positions = sorted(
+                {
+                    position
+                    for origin in record_dict[Fields.ORIGIN]
+                    for position in prior_positions_by_origin.get(origin, [])
+                }
+            )
+
+            if len(prior_positions) == 0:
                 self.review_manager.logger.debug("No prior records found")
                 continue
 
-            for prior_r in record_prior:
-                if self._record_corrected(prior_r=prior_r, record_dict=record_dict):
+            essential_md = self._get_essential_md(record_dict)
+            for position in prior_positions:
+                if prior_essential_md[position] != essential_md:
                     corrected_record = record_dict.copy()
 
                     self._create_change_item(
-                        original_record=prior_r,
+                        original_record=prior_records_list[position],
                         corrected_record=corrected_record,
                     )
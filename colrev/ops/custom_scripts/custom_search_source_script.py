@@ -56,12 +56,13 @@ class CustomSearch:
     def validate_search_params(cls, query: str) -> None:
         """Validate the search parameters"""
 
-        if " SCOPE " not in query:
+        scope_start = query.find(" SCOPE ")
+        if scope_start == -1:
             raise colrev_exceptions.InvalidQueryException(
                 "CROSSREF queries require a SCOPE section"
             )
 
-        scope = query[query.find(" SCOPE ") :]
+        scope = query[scope_start:]
         if "journal_issn" not in scope:
             raise colrev_exceptions.InvalidQueryException(
                 "CROSSREF queries require a journal_issn field in the SCOPE section"
@@ -2,10 +2,12 @@
 """Distribte records or PDFs to local CoLRev repositories."""
 from __future__ import annotations
 
+import codecs
 import os
 import shutil
 from pathlib import Path
 
+import colrev.loader.bib
 import colrev.process.operation
 import colrev.settings
 from colrev.constants import Fields
@@ -41,13 +43,18 @@ class Distribute(colrev.process.operation.Operation):
         """Get the next ID (incrementing counter)"""
         ids = []
         if bib_file.is_file():
-            with open(bib_file, encoding="utf8") as file:
-                line = file.readline()
-                while line:
-                    if "@" in line[:3]:
-                        current_id = line[line.find("{") + 1 : line.rfind(",")]
+            # Scan the raw bytes (the record headers are ASCII)
+            # instead of decoding each line
+            with open(
+                bib_file, "rb", buffering=colrev.loader.bib.READ_BUFFER_SIZE
+            ) as file:
+                for line_nr, line in enumerate(file):
+                    if line_nr == 0:
+                        # A byte order mark can only precede the first line
+                        line = line.removeprefix(codecs.BOM_UTF8)
+                    if b"@" in line[:3]:
+                        current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
                         ids.append(current_id)
-                    line = file.readline()
         max_id = max([int(cid) for cid in ids if cid.isdigit()] + [0]) + 1
         return max_id
 
@@ -61,12 +61,16 @@ class PDFGet(colrev.process.operation.Operation):
     def copy_pdfs_to_repo(self) -> None:
         """Copy the PDFs to the repository"""
         self.review_manager.logger.info("Copy PDFs to dir")
-        records = self.review_manager.dataset.load_records_dict()
+        # Only the file fields are needed: use the fast header-only parser
+        records_headers = self.review_manager.dataset.load_records_dict(
+            header_only=True
+        )
 
-        for record_dict in records.values():
-            if Fields.FILE not in record_dict:
+        for record_header in records_headers.values():
+            if Fields.FILE not in record_header:
                 continue
-            fpath = Path(record_dict[Fields.FILE])
+            # Note: the header-only parser returns the file as a Path
+            fpath = Path(record_header[Fields.FILE])
             new_fpath = fpath.absolute()
             if fpath.is_symlink():
                 linked_file = fpath.resolve()
@@ -74,12 +78,12 @@ class PDFGet(colrev.process.operation.Operation):
                     fpath.unlink()
                     shutil.copyfile(linked_file, new_fpath)
                     self.review_manager.logger.info(
-                        f" {Colors.GREEN}copied PDF for {record_dict[Fields.ID]} {Colors.END}"
+                        f" {Colors.GREEN}copied PDF for {record_header[Fields.ID]} {Colors.END}"
                     )
 
             elif new_fpath.is_file() and self.review_manager.verbose_mode:
                 self.review_manager.logger.info(
-                    f"No need to copy PDF - already exits ({record_dict[Fields.ID]})"
+                    f"No need to copy PDF - already exits ({record_header[Fields.ID]})"
                 )
 
     def link_pdf(
@@ -539,39 +543,31 @@ class PDFGet(colrev.process.operation.Operation):
 
         return pdf_get_data
 
+    @classmethod
+    def _get_stats_line(cls, *, label: str, count: int, color: str) -> str:
+        # Pad with format specifiers (instead of chained ljust/rjust calls)
+        unit = "PDF" if count == 1 else "PDFs"
+        if count == 0:
+            return f"{label:<34}{count:>6} {unit}"
+        return f"{label:<34}{color}{count:>6}{Colors.END} {unit}"
+
     def _print_stats(self, retrieved_record_list: list) -> None:
-        self.retrieved = len([r for r in retrieved_record_list if Fields.FILE in r])
+        self.retrieved = sum(1 for r in retrieved_record_list if Fields.FILE in r)
 
         self.not_retrieved = self.to_retrieve - self.retrieved
 
-        retrieved_string = "Overall pdf_imported".ljust(34)
-        if self.retrieved == 0:
-            retrieved_string += f"{self.retrieved}".rjust(6, " ")
-            retrieved_string += " PDFs"
-        elif self.retrieved == 1:
-            retrieved_string += f"{Colors.GREEN}"
-            retrieved_string += f"{self.retrieved}".rjust(6, " ")
-            retrieved_string += f"{Colors.END} PDF"
-        else:
-            retrieved_string += f"{Colors.GREEN}"
-            retrieved_string += f"{self.retrieved}".rjust(6, " ")
-            retrieved_string += f"{Colors.END} PDFs"
-
-        not_retrieved_string = "Overall pdf_needs_manual_retrieval".ljust(34)
-        if self.not_retrieved == 0:
-            not_retrieved_string += f"{self.not_retrieved}".rjust(6, " ")
-            not_retrieved_string += " PDFs"
-        elif self.not_retrieved == 1:
-            not_retrieved_string += f"{Colors.ORANGE}"
-            not_retrieved_string += f"{self.not_retrieved}".rjust(6, " ")
-            not_retrieved_string += f"{Colors.END} PDF"
-        else:
-            not_retrieved_string += f"{Colors.ORANGE}"
-            not_retrieved_string += f"{self.not_retrieved}".rjust(6, " ")
-            not_retrieved_string += f"{Colors.END} PDFs"
-
-        self.review_manager.logger.info(retrieved_string)
-        self.review_manager.logger.info(not_retrieved_string)
+        self.review_manager.logger.info(
+            self._get_stats_line(
+                label="Overall pdf_imported", count=self.retrieved, color=Colors.GREEN
+            )
+        )
+        self.review_manager.logger.info(
+            self._get_stats_line(
+                label="Overall pdf_needs_manual_retrieval",
+                count=self.not_retrieved,
+                color=Colors.ORANGE,
+            )
+        )
 
     def _set_status_if_pdf_linked(self, records: dict) -> dict:
         for record_dict in records.values():
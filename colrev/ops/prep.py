@@ -535,7 +535,7 @@ class Prep(colrev.process.operation.Operation):
 
         return record.get_data()
 
-    def _rename_files(self, records: dict) -> None:
+    def _rename_files(self, records: dict) -> bool:
         def file_rename_condition(record_dict: dict) -> bool:
             if Fields.FILE not in record_dict:
                 return False
@@ -549,10 +549,12 @@ class Prep(colrev.process.operation.Operation):
 
             return True
 
+        renamed = False
         for record_dict in records.values():
             if not file_rename_condition(record_dict):
                 continue
 
+            renamed = True
             old_filename = record_dict[Fields.FILE]
             new_filename = Path(record_dict[Fields.FILE]).parent / Path(
                 f"{record_dict[Fields.ID]}.pdf"
@@ -569,15 +571,16 @@ class Prep(colrev.process.operation.Operation):
                     new_string=str(new_filename),
                 )
                 self.review_manager.dataset.add_changes(pdfs_origin_file)
+        return renamed
 
     def set_ids(self) -> None:
         """Set IDs (regenerate). In force-mode, all IDs are regenerated and PDFs are renamed"""
 
         self.review_manager.logger.info("Set IDs")
-        records = self.review_manager.dataset.load_records_dict()
+        # Note: dataset.set_ids() loads and saves the records
         records = self.review_manager.dataset.set_ids()
-        self._rename_files(records)
-        self.review_manager.dataset.save_records_dict(records)
+        if self._rename_files(records):
+            self.review_manager.dataset.save_records_dict(records)
         self.review_manager.dataset.create_commit(msg="Set IDs")
 
     def setup_custom_script(self) -> None:
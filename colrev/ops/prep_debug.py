@@ -96,7 +96,7 @@ class PrepDebug(colrev.ops.prep.Prep):
             )
         )
 
-        original_records_ids = [r["ID"] for r in original_records]
+        original_records_ids = {r["ID"] for r in original_records}
         return [r for r in prior_records.values() if r["ID"] in original_records_ids]
 
     def _load_temp_prep_to_resume(self, prepare_data: dict) -> None:
@@ -136,8 +136,10 @@ class PrepMan(colrev.process.operation.Operation):
         self.review_manager.logger.info(
             f"Import language fields from {self.lang_prep_csv_path}"
         )
-        languages_df = pd.read_csv(self.lang_prep_csv_path)
-        language_records = languages_df.to_dict("records")
+        # Note : csv.DictReader keeps the values as strings
+        # (pandas would convert empty cells to nan and strip leading zeros of IDs)
+        with open(self.lang_prep_csv_path, encoding="utf-8", newline="") as file:
+            language_records = list(csv.DictReader(file))
         for language_record in language_records:
             if language_record["most_likely_language"] == "":
                 continue
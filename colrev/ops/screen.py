@@ -346,10 +346,10 @@ class Screen(colrev.process.operation.Operation):
         nr_screen_included = len(screen_included)
 
         self.review_manager.logger.info(
-            "Excluded".ljust(29) + f"{nr_screen_excluded}".rjust(10, " ") + " records"
+            f"{'Excluded':<29}{nr_screen_excluded:>10} records"
         )
         self.review_manager.logger.info(
-            "Included".ljust(29) + f"{nr_screen_included}".rjust(10, " ") + " records"
+            f"{'Included':<29}{nr_screen_included:>10} records"
         )
 
     def screen(
@@ -37,6 +37,20 @@ class Search(colrev.process.operation.Operation):
         self.review_manager = review_manager
         self.sources = review_manager.settings.sources
         self.package_manager = self.review_manager.get_package_manager()
+        self._installed_search_sources: typing.Optional[dict] = None
+        self._search_source_classes: typing.Dict[str, typing.Any] = {}
+
+    def _get_search_source_class(self, endpoint: str) -> typing.Any:
+        # Note: resolving the package (distribution) is expensive and
+        # the heuristics request the same endpoints for every new file
+        if endpoint not in self._search_source_classes:
+            self._search_source_classes[endpoint] = (
+                self.package_manager.get_package_endpoint_class(
+                    package_type=EndpointType.search_source,
+                    package_identifier=endpoint,
+                )
+            )
+        return self._search_source_classes[endpoint]
 
     def get_unique_filename(self, file_path_string: str, suffix: str = ".bib") -> Path:
         """Get a unique filename for a (new) SearchSource"""
@@ -51,12 +65,12 @@ class Search(colrev.process.operation.Operation):
         if file_path_string.endswith(suffix):
             file_path_string = file_path_string.rstrip(suffix)
         filename = Path(f"data/search/{file_path_string}{suffix}")
-        existing_filenames = [x.filename for x in self.sources]
-        if all(x != filename for x in existing_filenames):
+        existing_filenames = {x.filename for x in self.sources}
+        if filename not in existing_filenames:
             return filename
 
         i = 1
-        while not all(x != filename for x in existing_filenames):
+        while filename in existing_filenames:
             filename = Path(f"data/search/{file_path_string}_{i}{suffix}")
             i += 1
 
@@ -228,16 +242,16 @@ class Search(colrev.process.operation.Operation):
             logger=self.review_manager.logger,
         )
 
-        record_list = list(records.values())
-        before = len(record_list)
-        record_list = [
-            r for r in record_list if "forthcoming" != r.get(Fields.YEAR, "")
-        ]
-        removed = before - len(record_list)
+        before = len(records)
+        records = {
+            r[Fields.ID]: r
+            for r in records.values()
+            if r.get(Fields.YEAR, "") != "forthcoming"
+        }
+        removed = before - len(records)
         self.review_manager.logger.info(
             f"{Colors.GREEN}Removed {removed} forthcoming{Colors.END}"
         )
-        records = {r[Fields.ID]: r for r in record_list}
 
         write_file(records_dict=records, filename=source.filename)
 
@@ -250,10 +264,11 @@ class Search(colrev.process.operation.Operation):
             def new_f(self, *args, **kwds) -> typing.Callable:  # type: ignore
                 if kwds.get(var_name, None) is None:
                     return func_in(self, *args, **kwds)
+                source_filenames = {
+                    s.filename for s in self.review_manager.settings.sources
+                }
                 for search_source in kwds[var_name].split(","):
-                    if Path(search_source) not in [
-                        s.filename for s in self.review_manager.settings.sources
-                    ]:
+                    if Path(search_source) not in source_filenames:
                         raise colrev_exceptions.ParameterError(
                             parameter="select",
                             value=kwds[var_name],
@@ -279,10 +294,11 @@ class Search(colrev.process.operation.Operation):
 
         # Only files that are not yet registered
         # (also exclude bib files corresponding to a registered file)
+        source_filenames = {s.filename for s in self.review_manager.settings.sources}
         files = [
             f
             for f in files
-            if f not in [s.filename for s in self.review_manager.settings.sources]
+            if f not in source_filenames
             and not str(f).endswith("_query.txt")
             and not str(f).endswith(".tmp")
             and ".~lock" not in str(f)
@@ -300,10 +316,7 @@ class Search(colrev.process.operation.Operation):
         results_list = []
         for endpoint in search_sources:
             try:
-                search_source_class = self.package_manager.get_package_endpoint_class(
-                    package_type=EndpointType.search_source,
-                    package_identifier=endpoint,
-                )
+                search_source_class = self._get_search_source_class(endpoint)
                 res = search_source_class.heuristic(filepath, data)  # type: ignore
                 self.review_manager.logger.debug(f"- {endpoint}: {res['confidence']}")
                 if res["confidence"] == 0.0:
@@ -408,11 +421,18 @@ class Search(colrev.process.operation.Operation):
         {"filepath": ({"search_source": SourceCandidate1", "confidence": 0.98},..]}
         """
 
-        self.review_manager.logger.debug("Load available search_source endpoints...")
-
-        search_sources = self.package_manager.discover_installed_packages(
-            package_type=EndpointType.search_source
-        )
+        # Note: discovering the installed packages is expensive
+        # and the result does not change within an operation
+        if self._installed_search_sources is None:
+            self.review_manager.logger.debug(
+                "Load available search_source endpoints..."
+            )
+            self._installed_search_sources = (
+                self.package_manager.discover_installed_packages(
+                    package_type=EndpointType.search_source
+                )
+            )
+        search_sources = self._installed_search_sources
 
         heuristic_results = []
         self.review_manager.logger.debug(f"Discover new DB source file: {filename}")
@@ -474,10 +494,7 @@ class Search(colrev.process.operation.Operation):
                     f"data/search/{source.filename.name}"
                 )
 
-                search_source_class = self.package_manager.get_package_endpoint_class(
-                    package_type=EndpointType.search_source,
-                    package_identifier=source.endpoint,
-                )
+                search_source_class = self._get_search_source_class(source.endpoint)
                 endpoint = search_source_class(
                     source_operation=self, settings=source.model_dump()
                 )
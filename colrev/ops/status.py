@@ -2,16 +2,16 @@
 """CoLRev status operation: Display the project status."""
 from __future__ import annotations
 
-import io
 import typing
 
-import yaml
-
 import colrev.env.utils
 import colrev.process.operation
 from colrev.constants import Colors
 from colrev.constants import OperationsType
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.process.status
+
 
 class Status(colrev.process.operation.Operation):
     """Determine the status of the project"""
@@ -51,15 +51,13 @@ class Status(colrev.process.operation.Operation):
             committed_date,
             filecontents,
         ) in enumerate(revlist):
-            var_t = io.StringIO(filecontents.decode("utf-8"))
-
             # TBD: we could simply include the whole STATUS_FILE
             # (to create a general-purpose status analyzer)
             # -> flatten nested structures (e.g., overall/currently)
             # -> integrate with get_status (current data) -
             # and get_prior? (levels: aggregated_statistics vs. record-level?)
 
-            data_loaded = yaml.safe_load(var_t)
+            data_loaded = colrev.env.utils.load_yaml(filecontents.decode("utf-8"))
             analytics_dict[len(revlist) - ind] = {
                 "atomic_steps": data_loaded["atomic_steps"],
                 "completed_atomic_steps": data_loaded["completed_atomic_steps"],
@@ -80,11 +78,16 @@ class Status(colrev.process.operation.Operation):
         return analytics_dict
 
     def get_review_status_report(
-        self, *, records: typing.Optional[dict] = None, colors: bool = True
+        self,
+        *,
+        records: typing.Optional[dict] = None,
+        status_stats: typing.Optional[colrev.process.status.StatusStats] = None,
+        colors: bool = True,
     ) -> str:
         """Get the review status report"""
 
-        status_stats = self.review_manager.get_status_stats(records=records)
+        if status_stats is None:
+            status_stats = self.review_manager.get_status_stats(records=records)
 
         template = colrev.env.utils.get_template(template_path="ops/commit/status.txt")
 
@@ -2,6 +2,7 @@
 """Traces records and changes through history."""
 from __future__ import annotations
 
+import textwrap
 import time
 import typing
 
@@ -28,12 +29,7 @@ class Trace(colrev.process.operation.Operation):
 
     def _print_diff(self, *, diff: dict, color: str, lpad: int = 5) -> None:
         formatted_diff = self.review_manager.p_printer.pformat(diff)
-        lines = formatted_diff.splitlines()
-        print(
-            color
-            + "\n".join(["".join([" " * lpad]) + line for line in lines])
-            + Colors.END
-        )
+        print(color + textwrap.indent(formatted_diff, " " * lpad) + Colors.END)
 
     def _print_record_changes(
         self,
@@ -79,14 +75,16 @@ class Trace(colrev.process.operation.Operation):
         # Ensure the path uses forward slashes, which is compatible with Git's path handling
 
         revlist = self.review_manager.dataset.get_repo().iter_commits(
-            paths=self.review_manager.paths.RECORDS_FILE_GIT
+            paths=self.review_manager.paths.RECORDS_FILE_GIT, reverse=True
         )
 
+        # The ID as it appears in the record header (e.g., "@article{ID,")
+        record_header_bytes = b"{" + record_id.encode("utf-8") + b","
+        prev_blob_hexsha = ""
+        records_dict: dict = {}
         prev_record: dict = {}
-        for commit in reversed(list(revlist)):
-            filecontents = (
-                commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
-            ).data_stream.read()
+        for commit in revlist:
+            blob = commit.tree / self.review_manager.paths.RECORDS_FILE_GIT
             commit_message_first_line = str(commit.message).partition("\n")[0]
 
             if self.review_manager.verbose_mode:
@@ -100,11 +98,19 @@ class Trace(colrev.process.operation.Operation):
                     + f" {commit_message_first_line} (by {commit.author.name})"
                 )
 
-            records_dict = colrev.loader.load_utils.loads(
-                load_string=filecontents.decode("utf-8"),
-                implementation="bib",
-                logger=self.review_manager.logger,
-            )
+            # Parsing the records file is expensive:
+            # reuse the records if the blob did not change (e.g., reverts)
+            # and skip commits in which the record does not occur at all
+            if blob.hexsha != prev_blob_hexsha:
+                prev_blob_hexsha = blob.hexsha
+                filecontents = blob.data_stream.read()
+                records_dict = {}
+                if record_header_bytes in filecontents:
+                    records_dict = colrev.loader.load_utils.loads(
+                        load_string=filecontents.decode("utf-8"),
+                        implementation="bib",
+                        logger=self.review_manager.logger,
+                    )
 
             if record_id not in records_dict:
                 if self.review_manager.verbose_mode:
@@ -10,7 +10,6 @@ from importlib.metadata import version
 from pathlib import Path
 
 import git
-import pandas as pd
 from tqdm import tqdm
 from yaml import safe_load
 
@@ -681,8 +680,10 @@ class Upgrade(colrev.process.operation.Operation):
                 f"Found a yaml file, converting to json, it will be backed up as {backup_file}"
             )
             with open(registry_yaml, encoding="utf8") as file:
-                environment_registry_df = pd.json_normalize(safe_load(file))
-                repos = environment_registry_df.to_dict("records")
+                # The registry is a flat list of repo dicts: no DataFrame needed
+                repos = safe_load(file) or []
+                if isinstance(repos, dict):
+                    repos = [repos]
                 environment_registry = {
                     "local_index": {
                         "repos": repos,
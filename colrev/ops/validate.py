@@ -184,6 +184,19 @@ class Validate(colrev.process.operation.Operation):
         if merge_candidates_file.read_text(encoding="utf-8") == "":
             merge_candidates_file.unlink()
 
+    @classmethod
+    def _get_prior_positions_by_origin(
+        cls, prior_records_list: list
+    ) -> typing.Dict[str, list]:
+        # Index the prior records (with multiple origins) by origin
+        prior_positions_by_origin: typing.Dict[str, list] = {}
+        for position, prior_record in enumerate(prior_records_list):
+            if len(prior_record[Fields.ORIGIN]) == 1:
+                continue
+            for origin in prior_record[Fields.ORIGIN]:
+                prior_positions_by_origin.setdefault(origin, []).append(position)
+        return prior_positions_by_origin
+
     def _validate_dedupe_changes(self, *, report: dict, commit_sha: str) -> None:
         """Validate dedupe changes"""
 
@@ -221,6 +234,11 @@ class Validate(colrev.process.operation.Operation):
             report["dedupe"] = []
             return
 
+        prior_records_list = list(prior_records_dict.values())
+        prior_positions_by_origin = self._get_prior_positions_by_origin(
+            prior_records_list
+        )
+
         change_diff = []
         merged_records = False
         for record in records:
@@ -232,13 +250,16 @@ class Validate(colrev.process.operation.Operation):
                 continue
             merged_records = True
 
-            merged_records_list = []
-
-            for prior_record in prior_records_dict.values():
-                if len(prior_record[Fields.ORIGIN]) == 1:
-                    continue
-                if any(o in record[Fields.ORIGIN] for o in prior_record[Fields.ORIGIN]):
-                    merged_records_list.append(prior_record)
+            merged_records_list = [
+                prior_records_list[position]
+                for position in sorted(
+                    {
+                        position
+                        for origin in record[Fields.ORIGIN]
+                        for position in prior_positions_by_origin.get(origin, [])
+                    }
+                )
+            ]
 
             if len(merged_records_list) < 2:
                 # merged records not found
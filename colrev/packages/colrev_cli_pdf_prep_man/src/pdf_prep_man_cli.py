@@ -296,9 +296,11 @@ class CoLRevCLIPDFManPrep:
     ) -> dict:
         current_platform = platform.system()
         if current_platform in ["Linux", "Darwin"]:
-            os.system("clear")
+            # Run clear directly (instead of through a shell)
+            subprocess.run(["clear"], check=False)
         else:
-            os.system("cls")
+            # cls is a shell builtin
+            subprocess.run("cls", check=False, shell=True)
 
         # to do : if authors mismatch: color those that do/do not match
         print(stat)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import collections
-import os
 import typing
 from pathlib import Path
 
@@ -201,42 +200,33 @@ class ColrevCuration:
         *,
         markdown_output: str,
     ) -> None:
-        table_summary_tag = "<!-- TABLE_SUMMARY -->"
+        table_summary_tag = "<!-- TABLE_SUMMARY -->".encode("utf-8")
+        table = table_summary_tag + b"\n\n" + markdown_output.encode("utf-8") + b"\n"
         readme_path = self.review_manager.paths.readme
-        with open(readme_path, "r+b") as file:
-            appended = False
-            seekpos = file.tell()
+
+        # Replace the tables in memory and write the readme once
+        # (instead of splicing and fsyncing in place)
+        output = []
+        appended = False
+        with open(readme_path, "rb") as file:
             line = file.readline()
             while line:
-                if table_summary_tag.encode("utf-8") in line:
+                if table_summary_tag in line:
                     line = file.readline()
                     while (
                         b"Legend: *md_imported*, md_processed" not in line and line
-                    ):  # replace: drop the current record
+                    ):  # replace: drop the current table
                         line = file.readline()
-
-                    remaining = file.read()
-                    file.seek(seekpos)
-                    file.write(table_summary_tag.encode("utf-8"))
-                    file.write(b"\n\n")
-                    file.write(markdown_output.encode("utf-8"))
-                    file.write(b"\n")
-                    seekpos = file.tell()
-                    file.flush()
-                    os.fsync(file)
-                    file.write(remaining)
-                    file.truncate()  # if the replacement is shorter...
-                    file.seek(seekpos)
+                    output.append(table)
                     appended = True
-
-                seekpos = file.tell()
+                else:
+                    output.append(line)
                 line = file.readline()
-            if not appended:
-                file.write(b"\n")
-                file.write(table_summary_tag.encode("utf-8"))
-                file.write(b"\n\n")
-                file.write(markdown_output.encode("utf-8"))
-                file.write(b"\n")
+        if not appended:
+            output.append(b"\n" + table)
+
+        with open(readme_path, "wb") as file:
+            file.write(b"".join(output))
 
     def _update_stats_in_readme(
         self,
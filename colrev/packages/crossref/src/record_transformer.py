@@ -15,6 +15,7 @@ from colrev.constants import FieldValues
 # pylint: disable=duplicate-code
 
 TAG_RE = re.compile(r"<[a-z/][^<>]{0,12}>")
+WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _get_year(*, item: dict) -> str:
@@ -130,13 +131,13 @@ def _format_fields(*, record_dict: dict) -> dict:
         value = value.replace("<scp>", "{")
         value = value.replace("</scp>", "}")
         value = html.unescape(value)
-        value = re.sub(TAG_RE, " ", value)
+        value = TAG_RE.sub(" ", value)
         value = value.replace("\n", " ")
-        value = re.sub(r"\s+", " ", value).rstrip().lstrip("▪ ")
+        value = WHITESPACE_RE.sub(" ", value).rstrip().lstrip("▪ ")
         if key == Fields.ABSTRACT:
             if value.startswith("Abstract "):
                 value = value[8:]
-        record_dict[key] = value.lstrip().rstrip()
+        record_dict[key] = value.strip()
 
     return record_dict
 
@@ -93,11 +93,11 @@ class Obsidian:
         operation.review_manager.settings.data.data_package_endpoints.append(add_source)
 
     def _get_obsidian_missing(self, *, included: list) -> list:
-        in_obsidian = []
+        in_obsidian = set()
         for md_file in self.endpoint_paper_path.glob("*.md"):
             # missing: if todo in file
             if "#todo" not in md_file.read_text():
-                in_obsidian.append(str(md_file.name).replace(".md", ""))
+                in_obsidian.add(md_file.stem)
         return [x for x in included if x not in in_obsidian]
 
     def _get_keywords(self, *, record_dict: dict) -> list:
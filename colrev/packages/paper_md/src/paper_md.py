@@ -31,6 +31,9 @@ from colrev.constants import Fields
 from colrev.constants import Filepaths
 from colrev.writer.write_utils import write_file
 
+CSL_RE = re.compile(r"csl: ?\"([^\"\n]*)\"\n")
+RECORD_ITEM_RE = re.compile(r"- @(.*)$")
+
 
 class PaperMarkdownSettings(BaseModel):
     """Paper settings"""
@@ -177,7 +180,7 @@ class PaperMarkdown:
         csl_link = ""
         with open(self.settings.paper_path, encoding="utf-8") as file:
             for line in file:
-                csl_match = re.match(r"csl: ?\"([^\"\n]*)\"\n", line)
+                csl_match = CSL_RE.match(line)
                 if csl_match:
                     csl_link = csl_match.group(1)
 
@@ -792,9 +795,9 @@ class PaperMarkdown:
                 if self.NEW_RECORD_SOURCE_TAG in line:
                     while line:
                         line = file.readline()
-                        if re.search(r"- @.*", line):
-                            record_id = re.findall(r"- @(.*)$", line)
-                            to_synthesize.append(record_id[0])
+                        record_item_match = RECORD_ITEM_RE.search(line)
+                        if record_item_match:
+                            to_synthesize.append(record_item_match.group(1))
                             if line == "\n":
                                 break
 
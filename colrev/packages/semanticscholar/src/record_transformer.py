@@ -99,7 +99,7 @@ def _assign_abstract(*, record_dict: dict) -> None:
     """Method to assign external IDs from item"""
     abstract = record_dict.get("abstract", "")
     if abstract is not None:
-        record_dict[Fields.ABSTRACT] = abstract.replace("\n", " ").lstrip().rstrip()
+        record_dict[Fields.ABSTRACT] = abstract.replace("\n", " ").strip()
     else:
         record_dict[Fields.ABSTRACT] = ""
 
@@ -167,3 +167,9 @@ class ProcessModel:
                 raise colrev_exceptions.ProcessOrderViolation(
                     operation.type.name, str(state), list(violating_states)
                 )
+
+
+# (source, dest) -> trigger
+TRANSITION_TRIGGERS: typing.Dict[tuple, str] = {
+    (x["source"], x["dest"]): x["trigger"] for x in ProcessModel.transitions
+}
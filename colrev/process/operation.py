@@ -5,7 +5,6 @@ from __future__ import annotations
 import typing
 
 import docker
-import git
 from docker.errors import DockerException
 
 import colrev.exceptions as colrev_exceptions
@@ -79,7 +78,8 @@ class Operation:
     ) -> bool:
 
         # Note : not considering untracked files.
-        git_repo = git.Repo(self.review_manager.path)
+        # Reuse the repository of the dataset (instead of instantiating git.Repo)
+        git_repo = self.review_manager.dataset.get_repo()
 
         # Principle: working tree always has to be clean
         # because processing functions may change content
@@ -2,7 +2,9 @@
 """CoLRev status stats."""
 from __future__ import annotations
 
+import re
 import typing
+from collections import Counter
 
 from pydantic import BaseModel
 
@@ -10,6 +12,63 @@ import colrev.process.operation
 from colrev.constants import Fields
 from colrev.constants import RecordState
 from colrev.process.model import ProcessModel
+from colrev.process.model import TRANSITION_TRIGGERS
+
+# Screening criteria that led to the exclusion (e.g., "crit_b" in "crit_a=in;crit_b=out")
+EXCLUDED_CRITERION_RE = re.compile(r"(?:^|;)([^;=]+)=out(?=;|$)")
+
+# Fields of StatusStatsCurrently that count the records in a state
+CURRENTLY_STATES = {
+    "md_imported": RecordState.md_imported,
+    "md_needs_manual_preparation": RecordState.md_needs_manual_preparation,
+    "md_prepared": RecordState.md_prepared,
+    "md_processed": RecordState.md_processed,
+    "rev_prescreen_excluded": RecordState.rev_prescreen_excluded,
+    "rev_prescreen_included": RecordState.rev_prescreen_included,
+    "pdf_needs_manual_retrieval": RecordState.pdf_needs_manual_retrieval,
+    "pdf_not_available": RecordState.pdf_not_available,
+    "pdf_imported": RecordState.pdf_imported,
+    "pdf_needs_manual_preparation": RecordState.pdf_needs_manual_preparation,
+    "pdf_prepared": RecordState.pdf_prepared,
+    "rev_excluded": RecordState.rev_excluded,
+    "rev_included": RecordState.rev_included,
+    "rev_synthesized": RecordState.rev_synthesized,
+}
+
+# Fields of StatusStatsOverall that count the records in a state or beyond
+OVERALL_POST_STATES = {
+    field: frozenset(RecordState.get_post_x_states(state=colrev_status))
+    for field, colrev_status in {
+        "md_prepared": RecordState.md_prepared,
+        "md_processed": RecordState.md_processed,
+        "rev_prescreen": RecordState.md_processed,
+        "rev_prescreen_included": RecordState.rev_prescreen_included,
+        "pdf_imported": RecordState.pdf_imported,
+        "pdf_prepared": RecordState.pdf_prepared,
+        "rev_screen": RecordState.pdf_prepared,
+        "rev_included": RecordState.rev_included,
+        "rev_synthesized": RecordState.rev_synthesized,
+    }.items()
+}
+
+# (source, dest) -> trigger, allowing for reverse transitions
+REVERSIBLE_TRANSITION_TRIGGERS: typing.Dict[tuple, str] = {
+    **{
+        (dest, source): trigger
+        for (source, dest), trigger in TRANSITION_TRIGGERS.items()
+    },
+    **TRANSITION_TRIGGERS,
+}
+
+# States in which records require no further operations
+COMPLETED_STATES = frozenset(
+    [
+        RecordState.rev_synthesized,
+        RecordState.rev_excluded,
+        RecordState.rev_prescreen_excluded,
+        RecordState.pdf_not_available,
+    ]
+)
 
 
 class StatusStatsCurrently(BaseModel):
@@ -69,140 +128,62 @@ def _get_screening_statistics(
     review_manager: colrev.review_manager.ReviewManager,
     records: dict,
 ) -> dict:
-    screening_criteria = [
-        x[Fields.SCREENING_CRITERIA]
-        for x in records.values()
-        if x.get(Fields.SCREENING_CRITERIA, "") not in ["", "NA"]
-    ]
     criteria = list(review_manager.settings.screen.criteria.keys())
     screening_statistics = {crit: 0 for crit in criteria}
-    for screening_case in screening_criteria:
-        for criterion in screening_case.split(";"):
-            criterion_name, decision = criterion.split("=")
-            if decision == "out":
-                screening_statistics[criterion_name] += 1
-    return screening_statistics
-
-
-def _get_duplicates_removed(records: dict) -> int:
-    md_duplicates_removed = 0
+    if not criteria:
+        return screening_statistics
+    # Count the exclusions while iterating over the records
+    # (without collecting the screening criteria in a list first)
     for record_dict in records.values():
-        md_duplicates_removed += (
-            len([o for o in record_dict[Fields.ORIGIN] if not o.startswith("md_")]) - 1
-        )
-    return md_duplicates_removed
+        screening_case = record_dict.get(Fields.SCREENING_CRITERIA, "")
+        if screening_case in ["", "NA"]:
+            continue
+        for match in EXCLUDED_CRITERION_RE.finditer(screening_case):
+            screening_statistics[match.group(1)] += 1
+    return screening_statistics
 
 
-def _get_nr_origins(records: dict) -> int:
-    origin_list = [x[Fields.ORIGIN] for x in records.values()]
+def _scan_records(records: dict) -> typing.Tuple[dict, Counter, int]:
+    """Get the origin states, status frequencies, and number of (non-md) origins
+    in a single pass over the records"""
+    origin_states_dict = {}
+    status_freq: Counter = Counter()
     nr_origins = 0
-    for origin in origin_list:
-        nr_origins += len([o for o in origin if not o.startswith("md_")])
-    return nr_origins
+    for record_dict in records.values():
+        colrev_status = record_dict[Fields.STATUS]
+        status_freq[colrev_status] += 1
+        for origin in record_dict[Fields.ORIGIN]:
+            origin_states_dict[origin] = colrev_status
+            if not origin.startswith("md_"):
+                nr_origins += 1
+    return origin_states_dict, status_freq, nr_origins
 
 
 def _get_nr_incomplete(origin_states_dict: dict) -> int:
     """Get the number of incomplete records"""
-    return len(
-        [
-            x
-            for x in list(origin_states_dict.values())
-            if x
-            not in [
-                RecordState.rev_synthesized,
-                RecordState.rev_excluded,
-                RecordState.rev_prescreen_excluded,
-                RecordState.pdf_not_available,
-            ]
-        ]
-    )
-
-
-def _get_freq(*, status_list: list, colrev_status: RecordState) -> int:
-    return len([x for x in status_list if colrev_status == x])
+    return sum(1 for x in origin_states_dict.values() if x not in COMPLETED_STATES)
 
 
 def _get_status_stats_currently(
-    status_list: list, records: dict, screening_statistics: dict, md_retrieved: int
+    status_freq: Counter, records: dict, screening_statistics: dict, md_retrieved: int
 ) -> StatusStatsCurrently:
-    precreen_included = _get_freq(
-        status_list=status_list, colrev_status=RecordState.rev_prescreen_included
-    )
     data = {
-        "md_retrieved": md_retrieved,
-        "md_imported": _get_freq(
-            status_list=status_list, colrev_status=RecordState.md_imported
-        ),
-        "md_prepared": _get_freq(
-            status_list=status_list, colrev_status=RecordState.md_prepared
-        ),
-        "md_processed": _get_freq(
-            status_list=status_list, colrev_status=RecordState.md_processed
-        ),
-        "rev_prescreen_excluded": _get_freq(
-            status_list=status_list, colrev_status=RecordState.rev_prescreen_excluded
-        ),
-        "rev_prescreen_included": precreen_included,
-        "pdf_imported": _get_freq(
-            status_list=status_list, colrev_status=RecordState.pdf_imported
-        ),
-        "pdf_not_available": _get_freq(
-            status_list=status_list, colrev_status=RecordState.pdf_not_available
-        ),
-        "pdf_prepared": _get_freq(
-            status_list=status_list, colrev_status=RecordState.pdf_prepared
-        ),
-        "rev_excluded": _get_freq(
-            status_list=status_list, colrev_status=RecordState.rev_excluded
-        ),
-        "rev_included": _get_freq(
-            status_list=status_list, colrev_status=RecordState.rev_included
-        ),
-        "rev_synthesized": _get_freq(
-            status_list=status_list, colrev_status=RecordState.rev_synthesized
-        ),
-        "pdf_needs_retrieval": precreen_included,
-        "exclusion": screening_statistics,
-        "md_needs_manual_preparation": _get_freq(
-            status_list=status_list,
-            colrev_status=RecordState.md_needs_manual_preparation,
-        ),
-        "pdf_needs_manual_retrieval": _get_freq(
-            status_list=status_list,
-            colrev_status=RecordState.pdf_needs_manual_retrieval,
-        ),
-        "pdf_needs_manual_preparation": _get_freq(
-            status_list=status_list,
-            colrev_status=RecordState.pdf_needs_manual_preparation,
-        ),
-        "non_completed": len(
-            [
-                r
-                for r in records.values()
-                if r[Fields.STATUS]
-                not in [
-                    RecordState.rev_synthesized,
-                    RecordState.rev_prescreen_excluded,
-                    RecordState.pdf_not_available,
-                    RecordState.rev_excluded,
-                ]
-            ]
-        ),
+        field: status_freq[colrev_status]
+        for field, colrev_status in CURRENTLY_STATES.items()
     }
+    data.update(
+        {
+            "md_retrieved": md_retrieved,
+            "pdf_needs_retrieval": status_freq[RecordState.rev_prescreen_included],
+            "exclusion": screening_statistics,
+            "non_completed": len(records)
+            - sum(status_freq[state] for state in COMPLETED_STATES),
+        }
+    )
 
     return StatusStatsCurrently(**data)
 
 
-def _get_cumulative_freq(*, status_list: list, colrev_status: RecordState) -> int:
-    return len(
-        [
-            x
-            for x in status_list
-            if x in RecordState.get_post_x_states(state=colrev_status)
-        ]
-    )
-
-
 def _get_md_retrieved(sources: list) -> int:
     md_retrieved = 0
     for source in sources:
@@ -216,58 +197,29 @@ def _get_currently_md_retrieved(origin_states_dict: dict, md_retrieved: int) ->
 
     # select records that are not md_ records
     # (origin_states_dict only has records beyond md_retrieved)
-    non_md_records = {
-        k: v for k, v in origin_states_dict.items() if not k.startswith("md_")
-    }
+    nr_non_md_records = sum(1 for k in origin_states_dict if not k.startswith("md_"))
 
-    return md_retrieved - len(non_md_records)
+    return md_retrieved - nr_non_md_records
 
 
 def _get_status_stats_overall(
-    status_list: list, records: dict, md_retrieved: int
+    status_freq: Counter, records: dict, md_retrieved: int
 ) -> StatusStatsOverall:
 
     data = {
-        "md_retrieved": md_retrieved,
-        "md_imported": len(records.values()),
-        "md_prepared": _get_cumulative_freq(
-            status_list=status_list, colrev_status=RecordState.md_prepared
-        ),
-        "md_processed": _get_cumulative_freq(
-            status_list=status_list, colrev_status=RecordState.md_processed
-        ),
-        "rev_prescreen": _get_cumulative_freq(
-            status_list=status_list, colrev_status=RecordState.md_processed
-        ),
-        "rev_prescreen_included": _get_cumulative_freq(
-            status_list=status_list, colrev_status=RecordState.rev_prescreen_included
-        ),
-        "pdf_imported": _get_cumulative_freq(
-            status_list=status_list, colrev_status=RecordState.pdf_imported
-        ),
-        "pdf_prepared": _get_cumulative_freq(
-            status_list=status_list, colrev_status=RecordState.pdf_prepared
-        ),
-        "rev_screen": _get_cumulative_freq(
-            status_list=status_list, colrev_status=RecordState.pdf_prepared
-        ),
-        "rev_included": _get_cumulative_freq(
-            status_list=status_list, colrev_status=RecordState.rev_included
-        ),
-        "rev_synthesized": _get_cumulative_freq(
-            status_list=status_list, colrev_status=RecordState.rev_synthesized
-        ),
-        # Note: temporary states (_man_*) should not be covered in StatusStatsOverall
-        "rev_prescreen_excluded": _get_freq(
-            status_list=status_list, colrev_status=RecordState.rev_prescreen_excluded
-        ),
-        "rev_excluded": _get_freq(
-            status_list=status_list, colrev_status=RecordState.rev_excluded
-        ),
-        "pdf_not_available": _get_freq(
-            status_list=status_list, colrev_status=RecordState.pdf_not_available
-        ),
+        field: sum(status_freq[state] for state in post_states)
+        for field, post_states in OVERALL_POST_STATES.items()
     }
+    data.update(
+        {
+            "md_retrieved": md_retrieved,
+            "md_imported": len(records),
+            # Note: temporary states (_man_*) should not be covered in StatusStatsOverall
+            "rev_prescreen_excluded": status_freq[RecordState.rev_prescreen_excluded],
+            "rev_excluded": status_freq[RecordState.rev_excluded],
+            "pdf_not_available": status_freq[RecordState.pdf_not_available],
+        }
+    )
 
     return StatusStatsOverall(**data)
 
@@ -275,16 +227,13 @@ def _get_status_stats_overall(
 def _get_nr_curated_records(
     records: dict, curated: int, overall: StatusStatsOverall
 ) -> int:
-    nr_curated_records = len(
-        [
-            r
-            for r in records.values()
-            if colrev.record.record.Record(r).masterdata_is_curated()
-        ]
-    )
     if curated:  # pragma: no cover
-        nr_curated_records = overall.md_processed
-    return nr_curated_records
+        return overall.md_processed
+    return sum(
+        1
+        for r in records.values()
+        if colrev.record.record.Record(r).masterdata_is_curated()
+    )
 
 
 def _get_perc_curated(
@@ -353,6 +302,20 @@ def _get_atomic_steps(
     )
 
 
+def get_completeness_condition(
+    *,
+    review_manager: colrev.review_manager.ReviewManager,
+    records: dict,
+) -> bool:
+    """Get the completeness condition (without computing all status statistics)"""
+
+    origin_states_dict = _get_origin_states_dict(records)
+    if any(x not in COMPLETED_STATES for x in origin_states_dict.values()):
+        return False
+    md_retrieved = _get_md_retrieved(review_manager.settings.sources)
+    return 0 == _get_currently_md_retrieved(origin_states_dict, md_retrieved)
+
+
 # pylint: disable=no-member
 def get_status_stats(
     *,
@@ -361,31 +324,31 @@ def get_status_stats(
 ) -> StatusStats:
     """Get the status statistics"""
 
-    origin_states_dict = _get_origin_states_dict(records)
+    origin_states_dict, status_freq, nr_origins = _scan_records(records)
 
     screening_statistics = _get_screening_statistics(
         review_manager=review_manager, records=records
     )
-    status_list = [x[Fields.STATUS] for x in records.values()]
     sources = review_manager.settings.sources
     md_retrieved = _get_md_retrieved(sources)
     currently = _get_status_stats_currently(
-        status_list, records, screening_statistics, md_retrieved
+        status_freq, records, screening_statistics, md_retrieved
     )
-    overall = _get_status_stats_overall(status_list, records, md_retrieved)
+    overall = _get_status_stats_overall(status_freq, records, md_retrieved)
     currently.md_retrieved = _get_currently_md_retrieved(
         origin_states_dict, md_retrieved
     )
     nr_curated_records = _get_nr_curated_records(
         records, review_manager.settings.is_curated_masterdata_repo(), overall
     )
-    md_duplicates_removed = _get_duplicates_removed(records)
+    # Each record retains one of its (non-md) origins
+    md_duplicates_removed = nr_origins - len(records)
     nr_incomplete = _get_nr_incomplete(origin_states_dict)
 
     data = {
         "screening_statistics": screening_statistics,
         "md_duplicates_removed": md_duplicates_removed,
-        "nr_origins": _get_nr_origins(records),
+        "nr_origins": nr_origins,
         "nr_incomplete": nr_incomplete,
         "overall": overall,
         "currently": currently,
@@ -478,23 +441,10 @@ class StatusStats(BaseModel):
             if transitioned_record["source"] == transitioned_record["dest"]:
                 continue  # no_transition
 
-            operations_type = [
-                x["trigger"]
-                for x in ProcessModel.transitions
-                if (
-                    x["source"] == transitioned_record["source"]
-                    and x["dest"] == transitioned_record["dest"]
-                )
-                # Allow for reverse transitions
-                or (
-                    x["source"] == transitioned_record["dest"]
-                    and x["dest"] == transitioned_record["source"]
-                )
-            ]
-            if len(operations_type) == 0:
-                transitioned_record["type"] = "invalid_transition"
-            else:
-                transitioned_record["type"] = operations_type[0]
+            transitioned_record["type"] = REVERSIBLE_TRANSITION_TRIGGERS.get(
+                (transitioned_record["source"], transitioned_record["dest"]),
+                "invalid_transition",
+            )
 
             transitioned_records.append(transitioned_record)
 
@@ -503,18 +453,19 @@ class StatusStats(BaseModel):
     def get_priority_operations(self) -> list:
         """Get the priority operations"""
 
+        # Collect the current states once (instead of scanning all records
+        # for each state)
+        current_states = set(self.origin_states_dict.values())
+
         # get "earliest" states (going backward)
         earliest_state = []
         search_states = [RecordState.rev_synthesized]
         while True:
-            if any(
-                search_state in self.origin_states_dict.values()
-                for search_state in search_states
-            ):
+            if any(search_state in current_states for search_state in search_states):
                 earliest_state = [
                     search_state
                     for search_state in search_states
-                    if search_state in self.origin_states_dict.values()
+                    if search_state in current_states
                 ]
             search_states = [
                 x["source"]  # type: ignore
@@ -525,13 +476,13 @@ class StatusStats(BaseModel):
                 break
 
         # next: get the priority transition for the earliest states
-        priority_transitions = [
+        priority_transitions = {
             x["trigger"]
             for x in ProcessModel.transitions
             if x["source"] in earliest_state
-        ]
+        }
 
-        return list(set(priority_transitions))
+        return list(priority_transitions)
 
     def get_active_operations(self) -> list:
         """Get the active processing functions"""
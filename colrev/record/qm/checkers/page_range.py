@@ -16,6 +16,8 @@ class PageRangeChecker:
 
     msg = DefectCodes.PAGE_RANGE
 
+    _PAGE_RANGE_REGEX = re.compile(r"^(\d+)\-\-(\d+)$")
+
     def __init__(
         self, quality_model: colrev.record.qm.quality_model.QualityModel
     ) -> None:
@@ -24,22 +26,24 @@ class PageRangeChecker:
     def run(self, *, record: colrev.record.record.Record) -> None:
         """Run the page-range checks"""
 
-        if (
-            Fields.PAGES not in record.data
-            or record.ignored_defect(key=Fields.PAGES, defect=self.msg)
-            or not re.match(r"^\d+\-\-\d+$", record.data[Fields.PAGES])
+        if Fields.PAGES not in record.data or record.ignored_defect(
+            key=Fields.PAGES, defect=self.msg
         ):
             return
+        page_range_match = self._PAGE_RANGE_REGEX.match(record.data[Fields.PAGES])
+        if not page_range_match:
+            return
         if record.masterdata_is_curated():
             return
 
-        if self._pages_descending(pages=record.data[Fields.PAGES]):
+        if self._pages_descending(
+            from_page=page_range_match.group(1), to_page=page_range_match.group(2)
+        ):
             record.add_field_provenance_note(key=Fields.PAGES, note=self.msg)
         else:
             record.remove_field_provenance_note(key=Fields.PAGES, note=self.msg)
 
-    def _pages_descending(self, *, pages: str) -> bool:
-        from_page, to_page = re.findall(r"(\d+)", pages)
+    def _pages_descending(self, *, from_page: str, to_page: str) -> bool:
         if int(from_page) > int(to_page):
             return True
 
@@ -2,11 +2,11 @@
 """Functionality for record ID setting."""
 from __future__ import annotations
 
-import itertools
 import logging
 import re
 import string
 import typing
+from multiprocessing.pool import ThreadPool as Pool
 
 from tqdm import tqdm
 
@@ -23,6 +23,18 @@ from colrev.constants import RecordState
 
 # pylint: disable=too-few-public-methods
 
+PARENTHESES_RE = re.compile(r"\(.*\)")
+NON_ALPHANUMERIC_RE = re.compile("[^0-9a-zA-Z ]+")
+
+
+def _get_suffix(suffix_nr: int) -> str:
+    """Get the n-th suffix in the sequence a, ..., z, aa, ab, ..."""
+    suffix = ""
+    while suffix_nr > 0:
+        suffix_nr, remainder = divmod(suffix_nr - 1, 26)
+        suffix = string.ascii_lowercase[remainder] + suffix
+    return suffix
+
 
 class IDSetter:
     """The IDSetter class"""
@@ -81,8 +93,8 @@ class IDSetter:
         # (because IDs may be used as file names)
         temp_id = colrev.env.utils.remove_accents(temp_id)
         temp_id = temp_id.replace(" ", "")
-        temp_id = re.sub(r"\(.*\)", "", temp_id)
-        temp_id = re.sub("[^0-9a-zA-Z ]+", "", temp_id)
+        temp_id = PARENTHESES_RE.sub("", temp_id)
+        temp_id = NON_ALPHANUMERIC_RE.sub("", temp_id)
         if temp_id.isupper():  # pragma: no cover
             temp_id = temp_id.capitalize()
         return temp_id
@@ -91,46 +103,57 @@ class IDSetter:
         self,
         temp_id: str,
         *,
-        existing_ids: list,
+        existing_ids_lower: typing.Set[str],
     ) -> str:
-        """Get the next unique ID"""
+        """Get the next unique ID (existing IDs must be lower-cased)"""
 
-        order = 0
-        letters = list(string.ascii_lowercase)
         next_unique_id = temp_id
-        appends: list = []
-        while next_unique_id.lower() in [i.lower() for i in existing_ids]:
-            if len(appends) == 0:
-                order += 1
-                appends = list(itertools.product(letters, repeat=order))
-            next_unique_id = temp_id + "".join(list(appends.pop(0)))
-        temp_id = next_unique_id
-        return temp_id
+        suffix_nr = 0
+        while next_unique_id.lower() in existing_ids_lower:
+            suffix_nr += 1
+            next_unique_id = temp_id + _get_suffix(suffix_nr)
+        return next_unique_id
+
+    def _get_base_id(self, record_dict: dict) -> str:
+        if self.skip_local_index:
+            return self._generate_id_from_pattern(record_dict)
+        try:
+            retrieved_record = self.local_index.retrieve(record_dict)
+            return retrieved_record.data[Fields.ID]  # pragma: no cover
+        except (
+            colrev_exceptions.RecordNotInIndexException,
+            colrev_exceptions.NotEnoughDataToIdentifyException,
+        ):
+            return self._generate_id_from_pattern(record_dict)
+
+    def _get_base_ids(self, record_dicts: list) -> dict:
+        if self.skip_local_index or len(record_dicts) < 2:
+            base_ids = [self._get_base_id(r) for r in tqdm(record_dicts)]
+        else:
+            # LocalIndex retrieval is I/O-bound: retrieve IDs in parallel
+            # (making IDs unique remains sequential)
+            with Pool(4) as pool:
+                base_ids = list(
+                    tqdm(
+                        pool.imap(self._get_base_id, record_dicts),
+                        total=len(record_dicts),
+                    )
+                )
+        return {r[Fields.ID]: base_id for r, base_id in zip(record_dicts, base_ids)}
 
     def _generate_id(
         self,
         record_dict: dict,
         *,
-        existing_ids: typing.Optional[list] = None,
+        existing_ids: typing.Optional[typing.Collection[str]] = None,
     ) -> str:
         """Generate a blacklist to avoid setting duplicate IDs"""
 
-        if self.skip_local_index:
-            temp_id = self._generate_id_from_pattern(record_dict)
-        else:
-            try:
-                retrieved_record = self.local_index.retrieve(record_dict)
-                temp_id = retrieved_record.data[Fields.ID]  # pragma: no cover
-            except (
-                colrev_exceptions.RecordNotInIndexException,
-                colrev_exceptions.NotEnoughDataToIdentifyException,
-            ):
-                temp_id = self._generate_id_from_pattern(record_dict)
-
+        temp_id = self._get_base_id(record_dict)
         if existing_ids:
             temp_id = self._make_id_unique(
                 temp_id,
-                existing_ids=existing_ids,
+                existing_ids_lower={i.lower() for i in existing_ids},
             )
 
         return temp_id
@@ -140,44 +163,51 @@ class IDSetter:
     ) -> dict:
         """Set the IDs for the records in the dataset"""
 
-        id_list = list(records.keys())
+        # Taken IDs are lower-cased (IDs must be unique regardless of case)
+        id_set = {record_id.lower() for record_id in records}
 
-        for record_id in tqdm(list(records.keys())):
+        if selected_ids is not None:
+            record_ids = [
+                record_id for record_id in records if record_id in selected_ids
+            ]
+        else:
+            record_ids = [
+                record_id
+                for record_id, record_dict in records.items()
+                if record_dict[Fields.STATUS]
+                in [RecordState.md_imported, RecordState.md_prepared]
+            ]
+        # Only change IDs that are before md_processed
+        # (selected records are changed regardless of their status)
+        post_md_processed_states = RecordState.get_post_x_states(
+            state=RecordState.md_processed
+        )
+        # Retrieve base IDs only for the records whose IDs are changed
+        base_ids = self._get_base_ids(
+            [
+                records[record_id]
+                for record_id in record_ids
+                if selected_ids
+                or records[record_id][Fields.STATUS] not in post_md_processed_states
+            ]
+        )
+
+        for record_id in record_ids:
             record_dict = records[record_id]
-            if selected_ids is not None:
-                if record_id not in selected_ids:  # pragma: no cover
-                    continue
-            elif record_dict[Fields.STATUS] not in [
-                RecordState.md_imported,
-                RecordState.md_prepared,
-            ]:
-                continue
-            old_id = record_id
-
-            temp_stat = record_dict[Fields.STATUS]
-            if selected_ids:
-                record = colrev.record.record.Record(record_dict)
-                record.set_status(RecordState.md_prepared)
-
-            new_id = old_id
-            # Only change IDs that are before md_processed
-            if record_dict[Fields.STATUS] not in RecordState.get_post_x_states(
-                state=RecordState.md_processed
-            ):
-                new_id = self._generate_id(
-                    record_dict,
-                    existing_ids=[x for x in id_list if x != record_id],
-                )
 
-            if selected_ids:
-                record = colrev.record.record.Record(record_dict)
-                record.set_status(temp_stat)
+            new_id = record_id
+            if record_id in base_ids:
+                # Exclude the record's own ID while generating its new ID
+                id_set.discard(record_id.lower())
+                new_id = self._make_id_unique(
+                    base_ids[record_id], existing_ids_lower=id_set
+                )
 
             self._update_id(
                 records,
-                id_list=id_list,
+                id_set=id_set,
                 record_dict=record_dict,
-                old_id=old_id,
+                old_id=record_id,
                 new_id=new_id,
             )
 
@@ -188,12 +218,12 @@ class IDSetter:
         self,
         records: dict,
         *,
-        id_list: list,
+        id_set: set,
         record_dict: dict,
         old_id: str,
         new_id: str,
     ) -> None:
-        id_list.append(new_id)
+        id_set.add(new_id.lower())
         if old_id != new_id:
             # We need to insert the a new element into records
             # to make sure that the IDs are actually saved
@@ -201,5 +231,5 @@ class IDSetter:
             records[new_id] = record_dict
             del records[old_id]
             self.logger.info(f"set_ids({old_id}) to {new_id}")
-            if old_id in id_list:
-                id_list.remove(old_id)
+            if old_id.lower() != new_id.lower():
+                id_set.discard(old_id.lower())
@@ -2,6 +2,7 @@
 """The CoLRev review manager (main entrypoint)."""
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pprint
@@ -12,21 +13,30 @@ from pathlib import Path
 import git
 import requests_cache
 import yaml
+from pydantic import ValidationError
 
 import colrev.dataset
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.logger
 import colrev.ops.check
 import colrev.ops.checker
 import colrev.process.operation
+import colrev.process.status
 import colrev.record.qm.quality_model
 import colrev.settings
 from colrev.constants import Colors
 from colrev.constants import Filepaths
 from colrev.constants import OperationsType
+from colrev.constants import RecordState
 from colrev.paths import PathManager
 
 
+# Status stats of the last computation (in the git directory)
+# First line: cache key, second line: status stats (both JSON)
+STATUS_STATS_CACHE_FILE = "colrev_status_stats.json"
+
+
 class ReviewManager:
     """Class for managing individual CoLRev review project (repositories)"""
 
@@ -75,6 +85,9 @@ class ReviewManager:
         self.paths = PathManager(self.path)
 
         self.exact_call = exact_call
+        self._status_stats_cache: typing.Optional[
+            typing.Tuple[list, colrev.process.status.StatusStats]
+        ] = None
 
         try:
             if self.paths.settings.is_file():
@@ -154,7 +167,8 @@ class ReviewManager:
         else:
             original_dir = Path.cwd()
 
-        while ".git" not in [f.name for f in original_dir.iterdir() if f.is_dir()]:
+        # Check for .git directly (instead of listing and stat'ing all entries)
+        while not (original_dir / Path(".git")).is_dir():
             if original_dir.parent == original_dir:  # reached root
                 break
             original_dir = original_dir.parent
@@ -251,11 +265,15 @@ class ReviewManager:
         """Update the STATUS_FILE"""
 
         status_stats = self.get_status_stats(records=records)
-        exported_dict = status_stats.model_dump()
-        exported_dict.pop("origin_states_dict")
-        exported_dict.pop("perc_curated")
-        exported_dict.pop("screening_statistics")
-        exported_dict.pop("nr_origins")
+        # Exclude fields upfront (origin_states_dict has an entry per origin)
+        exported_dict = status_stats.model_dump(
+            exclude={
+                "origin_states_dict",
+                "perc_curated",
+                "screening_statistics",
+                "nr_origins",
+            }
+        )
         with open(self.paths.status, "w", encoding="utf8") as file:
             yaml.dump(exported_dict, file, allow_unicode=True)
         if add_to_git:
@@ -324,20 +342,110 @@ class ReviewManager:
     ) -> colrev.process.status.StatusStats:  # pragma: no cover
         """Get a status stats object"""
 
-        import colrev.process.status
+        if records is not None:
+            colrev.ops.check.CheckOperation(self)
+            return colrev.process.status.get_status_stats(
+                review_manager=self, records=records
+            )
+
+        cache_key, status_stats = self._get_cached_status_stats()
+        if status_stats is not None:
+            return status_stats.model_copy(deep=True)
+
+        status_stats = colrev.process.status.get_status_stats(
+            review_manager=self, records=self.dataset.load_records_dict()
+        )
+        self._status_stats_cache = (cache_key, status_stats.model_copy(deep=True))
+        self._save_status_stats_cache()
+        return status_stats
 
+    def _get_cached_status_stats(
+        self,
+    ) -> typing.Tuple[list, typing.Optional[colrev.process.status.StatusStats]]:
+        # Reuse the status stats if the records, search files and settings
+        # did not change (e.g., update_status_yaml() and
+        # get_completeness_condition() in the same commit)
         colrev.ops.check.CheckOperation(self)
 
-        if records is None:
-            records = self.dataset.load_records_dict()
-        return colrev.process.status.get_status_stats(
-            review_manager=self, records=records
+        cache_key = self._get_status_stats_cache_key()
+        if not self._status_stats_cache or self._status_stats_cache[0] != cache_key:
+            # Other processes may have stored the current status stats
+            self._status_stats_cache = self._load_status_stats_cache(cache_key)
+        if self._status_stats_cache:
+            return cache_key, self._status_stats_cache[1]
+        return cache_key, None
+
+    def _get_status_stats_cache_path(self) -> Path:
+        # Stored in the git directory (not part of the project or working tree)
+        return Path(self.dataset.get_repo().git_dir) / Path(STATUS_STATS_CACHE_FILE)
+
+    def _load_status_stats_cache(
+        self, cache_key: list
+    ) -> typing.Optional[typing.Tuple[list, colrev.process.status.StatusStats]]:
+        # Status stats are also reused across processes (e.g., pre-commit hooks)
+        # Note: the key is checked before the status stats are parsed and
+        # missing or invalid cache files are treated as a cache miss
+        try:
+            with open(self._get_status_stats_cache_path(), encoding="utf-8") as file:
+                if json.loads(file.readline()) != cache_key:
+                    return None
+                data = json.loads(file.readline())
+            data["origin_states_dict"] = {
+                origin: RecordState(state)
+                for origin, state in data["origin_states_dict"].items()
+            }
+            return cache_key, colrev.process.status.StatusStats(**data)
+        except (OSError, ValueError, KeyError, ValidationError):
+            return None
+
+    def _save_status_stats_cache(self) -> None:
+        assert self._status_stats_cache is not None
+        cache_key, status_stats = self._status_stats_cache
+        content = (
+            json.dumps(cache_key)
+            + "\n"
+            + json.dumps(status_stats.model_dump(mode="json"))
+            + "\n"
         )
+        cache_path = self._get_status_stats_cache_path()
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            # Replace the file atomically (concurrent processes read it)
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:  # pragma: no cover
+            tmp_path.unlink(missing_ok=True)
+
+    def _get_status_stats_cache_key(self) -> list:
+        # Plain data (compared before loading the cached status stats)
+        # Note: files are identified by their signature (without reading them)
+        # and only the settings used by the status stats are included
+        return [
+            colrev.__version__,
+            list(colrev.env.utils.get_file_signature(self.paths.records)),
+            [
+                [
+                    str(source.filename),
+                    list(
+                        colrev.env.utils.get_file_signature(self.path / source.filename)
+                    ),
+                ]
+                for source in self.settings.sources
+            ],
+            sorted(self.settings.screen.criteria.keys()),
+            self.settings.is_curated_masterdata_repo(),
+        ]
 
     def get_completeness_condition(self) -> bool:
         """Get the completeness condition"""
-        status_stats = self.get_status_stats()
-        return status_stats.completeness_condition
+
+        _, status_stats = self._get_cached_status_stats()
+        if status_stats is not None:
+            return status_stats.completeness_condition
+
+        return colrev.process.status.get_completeness_condition(
+            review_manager=self, records=self.dataset.load_records_dict()
+        )
 
     @classmethod
     def get_package_manager(
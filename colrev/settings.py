@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import typing
+from collections import Counter
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -476,7 +477,7 @@ def _load_settings_from_dict(loaded_dict: dict) -> Settings:
         settings = Settings(**loaded_dict)
         filenames = [x.filename for x in settings.sources]
         if not len(filenames) == len(set(filenames)):
-            non_unique = list({str(x) for x in filenames if filenames.count(x) > 1})
+            non_unique = [str(k) for k, v in Counter(filenames).items() if v > 1]
             msg = f"Non-unique source filename(s): {', '.join(non_unique)}"
             raise colrev_exceptions.InvalidSettingsError(msg=msg, fix_per_upgrade=False)
 
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import sys
 import typing
-from time import sleep
 
 from tqdm import tqdm
 
@@ -19,7 +18,8 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 def print_review_instructions(review_instructions: dict) -> None:
     """Print the review instructions on cli"""
 
-    print("Next operation")
+    # Collect the lines and print them at once
+    lines = ["Next operation"]
 
     verbose = False
 
@@ -27,12 +27,12 @@ def print_review_instructions(review_instructions: dict) -> None:
     # keys = [item for sublist in key_list for item in sublist]
     # priority_item_set = "priority" in keys
     if not review_instructions:
-        print(f"    {Colors.GREEN}Review iteration completed{Colors.END}")
-        print(
+        lines.append(f"    {Colors.GREEN}Review iteration completed{Colors.END}")
+        lines.append(
             f"    {Colors.ORANGE}To start the next iteration of the review, run the search\n "
             f"    colrev search{Colors.END}"
         )
-        print()
+        lines.append("")
 
     for review_instruction in review_instructions:
         # prioritize based on the order of instructions (most important first)
@@ -40,54 +40,60 @@ def print_review_instructions(review_instructions: dict) -> None:
         #     continue
 
         if "info" in review_instruction:
-            print("    " + review_instruction["info"])
+            lines.append("    " + review_instruction["info"])
         if "msg" in review_instruction:
             if "cmd" in review_instruction:
                 if verbose:
-                    print("    " + review_instruction["msg"] + ", i.e., use ")
-                print(f'    {Colors.ORANGE}{review_instruction["cmd"]}{Colors.END}')
+                    lines.append("    " + review_instruction["msg"] + ", i.e., use ")
+                lines.append(
+                    f'    {Colors.ORANGE}{review_instruction["cmd"]}{Colors.END}'
+                )
             else:
-                print(f"    {Colors.ORANGE}{review_instruction['msg']}{Colors.END}")
+                lines.append(
+                    f"    {Colors.ORANGE}{review_instruction['msg']}{Colors.END}"
+                )
         if "cmd_after" in review_instruction:
-            print("    Then use " + review_instruction["cmd_after"])
-        print()
+            lines.append("    Then use " + review_instruction["cmd_after"])
+        lines.append("")
+
+    print("\n".join(lines))
 
 
-def _print_collaboration_instructions_status(
-    *, collaboration_instructions: dict
+def _append_collaboration_instructions_status(
+    *, collaboration_instructions: dict, lines: list
 ) -> None:
     if "status" not in collaboration_instructions:
         return
     if "title" in collaboration_instructions["status"]:
         title = collaboration_instructions["status"]["title"]
         if collaboration_instructions["status"].get("level", "NA") == "WARNING":
-            print(f"  {Colors.RED}{title}{Colors.END}")
+            lines.append(f"  {Colors.RED}{title}{Colors.END}")
         elif collaboration_instructions["status"].get("level", "NA") == "SUCCESS":
-            print(f"  {Colors.GREEN}{title}{Colors.END}")
+            lines.append(f"  {Colors.GREEN}{title}{Colors.END}")
         else:
-            print("  " + title)
+            lines.append("  " + title)
     if "msg" in collaboration_instructions["status"]:
-        print(f'  {collaboration_instructions["status"]["msg"]}')
+        lines.append(f'  {collaboration_instructions["status"]["msg"]}')
 
 
-def _print_collaboration_instructions_items(
-    *, collaboration_instructions: dict
+def _append_collaboration_instructions_items(
+    *, collaboration_instructions: dict, lines: list
 ) -> None:
     for item in collaboration_instructions["items"]:
         if "title" in item:
             if "level" in item:
                 if item["level"] == "WARNING":
-                    print(f"  {Colors.RED}{item['title']}{Colors.END}")
+                    lines.append(f"  {Colors.RED}{item['title']}{Colors.END}")
                 elif item["level"] == "SUCCESS":
-                    print(f"  {Colors.GREEN}{item['title']}{Colors.END}")
+                    lines.append(f"  {Colors.GREEN}{item['title']}{Colors.END}")
             else:
-                print("  " + item["title"])
+                lines.append("  " + item["title"])
 
         if "msg" in item:
-            print("  " + item["msg"])
+            lines.append("  " + item["msg"])
         if "cmd_after" in item:
-            print(f'  {item["cmd_after"]}')
-        print()
+            lines.append(f'  {item["cmd_after"]}')
+        lines.append("")
 
 
 def print_collaboration_instructions(
@@ -105,13 +111,14 @@ def print_collaboration_instructions(
         ]:
             return
 
-    print("Versioning and collaboration")
-    _print_collaboration_instructions_status(
-        collaboration_instructions=collaboration_instructions
+    lines = ["Versioning and collaboration"]
+    _append_collaboration_instructions_status(
+        collaboration_instructions=collaboration_instructions, lines=lines
     )
-    _print_collaboration_instructions_items(
-        collaboration_instructions=collaboration_instructions
+    _append_collaboration_instructions_items(
+        collaboration_instructions=collaboration_instructions, lines=lines
     )
+    print("\n".join(lines))
 
 
 def print_environment_instructions(environment_instructions: dict) -> None:
@@ -120,7 +127,7 @@ def print_environment_instructions(environment_instructions: dict) -> None:
     if not environment_instructions:
         return
 
-    print("CoLRev environment\n")
+    lines = ["CoLRev environment\n"]
 
     key_list = [list(x.keys()) for x in environment_instructions]
     keys = [item for sublist in key_list for item in sublist]
@@ -130,16 +137,20 @@ def print_environment_instructions(environment_instructions: dict) -> None:
         if priority_item_set and "priority" not in environment_instruction.keys():
             continue
         if "info" in environment_instruction:
-            print("  " + environment_instruction["info"])
+            lines.append("  " + environment_instruction["info"])
         if "msg" in environment_instruction:
             if "cmd" in environment_instruction:
-                print("  " + environment_instruction["msg"] + "  i.e., use ")
-                print(f'  {Colors.ORANGE}{environment_instruction["cmd"]}{Colors.END}')
+                lines.append("  " + environment_instruction["msg"] + "  i.e., use ")
+                lines.append(
+                    f'  {Colors.ORANGE}{environment_instruction["cmd"]}{Colors.END}'
+                )
             else:
-                print("  " + environment_instruction["msg"])
+                lines.append("  " + environment_instruction["msg"])
         if "cmd_after" in environment_instruction:
-            print("  Then use " + environment_instruction["cmd_after"])
-        print()
+            lines.append("  Then use " + environment_instruction["cmd_after"])
+        lines.append("")
+
+    print("\n".join(lines))
 
 
 def print_progress(*, total_atomic_steps: int, completed_steps: int) -> None:
@@ -149,23 +160,22 @@ def print_progress(*, total_atomic_steps: int, completed_steps: int) -> None:
     # possible extension: estimate the number of manual tasks (making assumptions on
     # frequencies of man-prep, ...)?
 
+    current_percentage = 0
     if total_atomic_steps != 0:
         current_percentage = int((completed_steps / total_atomic_steps) * 100)
-    else:
-        current_percentage = -1
 
-    sleep_interval = 1.1 / max(current_percentage, 100)
     print()
-
-    for i in tqdm(
-        range(100),
-        desc="    Progress:",
-        bar_format="{desc} |{bar}|{percentage:.0f}%",
-        ncols=40,
-    ):
-        sleep(sleep_interval)
-        if current_percentage in [i, -1]:
-            break
+    # Render the bar at its final state (instead of animating it with sleeps)
+    print(
+        tqdm.format_meter(
+            n=min(current_percentage, 100),
+            total=100,
+            elapsed=0,
+            prefix="    Progress:",
+            bar_format="{desc} |{bar}|{percentage:.0f}%",
+            ncols=40,
+        )
+    )
 
 
 def print_project_status(status_operation: colrev.ops.status.Status) -> None:
@@ -189,8 +199,9 @@ def print_project_status(status_operation: colrev.ops.status.Status) -> None:
         advisor = status_operation.review_manager.get_advisor()
         status_stats = advisor.status_stats
 
+        # The status stats computed by the advisor are reused
         status_report = status_operation.get_review_status_report(
-            records=checker.records
+            status_stats=status_stats
         )
         print(status_report)
 
@@ -22,8 +22,8 @@ def setup_custom_search_script(
     )
 
     if filedata:
-        with open("custom_search_source_script.py", "w", encoding="utf-8") as file:
-            file.write(filedata.decode("utf-8"))
+        with open("custom_search_source_script.py", "wb") as file:
+            file.write(filedata)
 
     review_manager.dataset.add_changes(Path("custom_search_source_script.py"))
 
@@ -27,9 +27,15 @@ def print_sample(review_manager: colrev.review_manager.ReviewManager) -> None:
     ]
     if 0 == len(sample):
         print("No records included in sample (yet)")
+        return
 
-    for sample_r in sample:
-        colrev.record.record.Record(sample_r).print_citation_format()
+    # Print the sample at once (instead of one write per record)
+    print(
+        "\n".join(
+            colrev.record.record.Record(sample_r).get_citation_format()
+            for sample_r in sample
+        )
+    )
 
 
 def print_venv_notes() -> None:
@@ -2,7 +2,6 @@
 """Convenience functions to write bib files"""
 from __future__ import annotations
 
-from copy import deepcopy
 from pathlib import Path
 
 from colrev.constants import Fields
@@ -35,6 +34,22 @@ RECORDS_FIELD_ORDER = [
     Fields.URL,
     Fields.ABSTRACT,
 ]
+# Fields that are not written in the (sorted) remaining fields
+_NON_SORTED_FIELDS = set(RECORDS_FIELD_ORDER + [Fields.ID, Fields.ENTRYTYPE])
+
+
+# Note: most records share the same fields, so the padded field prefix
+# is formatted once per field name (instead of once per record and field)
+_FIELD_PREFIXES: dict = {}
+
+
+def _get_field_prefix(field: str) -> str:
+    prefix = _FIELD_PREFIXES.get(field)
+    if prefix is None:
+        padd = " " * max(0, 28 - len(field))
+        prefix = f",\n   {field} {padd} = {{"
+        _FIELD_PREFIXES[field] = prefix
+    return prefix
 
 
 def _save_field_dict(*, input_dict: dict, input_key: str) -> list:
@@ -57,7 +72,8 @@ def _save_field_dict(*, input_dict: dict, input_key: str) -> list:
 
 
 def _get_stringified_record(*, record_dict: dict) -> dict:
-    data_copy = deepcopy(record_dict)
+    # Note: a shallow copy suffices because fields are replaced (not modified)
+    data_copy = dict(record_dict)
 
     def list_to_str(*, val: list) -> str:
         return ("\n" + " " * 36).join([f.rstrip() for f in val])
@@ -86,16 +102,13 @@ def _get_stringified_record(*, record_dict: dict) -> dict:
 
 def to_string(*, records_dict: dict) -> str:
     """Convert a records dict to a bibtex string"""
-    # Note: we need a deepcopy because the parsing modifies dicts
-    recs_dict = deepcopy(records_dict)
 
     def format_field(field: str, value: str) -> str:
-        padd = " " * max(0, 28 - len(field))
-        return f",\n   {field} {padd} = {{{value}}}"
+        return f"{_get_field_prefix(field)}{value}}}"
 
     bibtex_str = ""
     first = True
-    for record_id, record_dict in sorted(recs_dict.items()):
+    for record_id, record_dict in sorted(records_dict.items()):
         if not first:
             bibtex_str += "\n"
         first = False
@@ -111,7 +124,7 @@ def to_string(*, records_dict: dict) -> str:
                 bibtex_str += format_field(ordered_field, record_dict[ordered_field])
 
         for key in sorted(record_dict.keys()):
-            if key in RECORDS_FIELD_ORDER + [Fields.ID, Fields.ENTRYTYPE]:
+            if key in _NON_SORTED_FIELDS:
                 continue
 
             bibtex_str += format_field(key, record_dict[key])
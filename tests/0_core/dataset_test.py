@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 """Tests for the dataset"""
+import os
+import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -418,6 +420,40 @@ def test_has_untracked_search_records_present(
     untracked_search_file_path.unlink()
 
 
+@pytest.mark.parametrize("modified_before_load", [True, False])
+def test_load_records_dict_in_place_change(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    modified_before_load: bool,
+) -> None:
+    """Test that loaded records are not reused after in-place changes of the same size."""
+
+    base_repo_review_manager.notified_next_operation = OperationsType.check
+    records_file = base_repo_review_manager.paths.records
+    if modified_before_load:
+        # Recently modified: a same-size rewrite may not change the mtime
+        records_file.write_bytes(records_file.read_bytes())
+    else:
+        past = time.time() - 3600
+        os.utime(records_file, (past, past))
+
+    for _ in range(2):
+        records = base_repo_review_manager.dataset.load_records_dict()
+        assert records["SrivastavaShainesh2015"][Fields.YEAR] == "2015"
+
+    # Rewrite the file in place (same inode and size)
+    stat = records_file.stat()
+    content = records_file.read_bytes()
+    with open(records_file, "r+b") as file:
+        file.write(content.replace(b"{2015}", b"{2016}"))
+    assert len(records_file.read_bytes()) == len(content)
+    if modified_before_load:
+        # Simulate a write within the timestamp granularity (unchanged mtime)
+        os.utime(records_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    records = base_repo_review_manager.dataset.load_records_dict()
+    assert records["SrivastavaShainesh2015"][Fields.YEAR] == "2016"
+
+
 def test_get_repo(
     base_repo_review_manager: colrev.review_manager.ReviewManager,
 ) -> None:
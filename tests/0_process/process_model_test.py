@@ -5,6 +5,8 @@ import pytest
 from colrev.constants import OperationsType
 from colrev.constants import RecordState
 from colrev.process.model import ProcessModel
+from colrev.process.model import TRANSITION_TRIGGERS
+from colrev.process.status import REVERSIBLE_TRANSITION_TRIGGERS
 
 
 def test_model() -> None:
@@ -249,3 +251,28 @@ def test_leq() -> None:
     # TODO : create ordered list, remove left element and
     # assert that it is smaller than all remaining elements
     assert RecordState.md_retrieved < RecordState.md_imported
+
+
+def test_transition_triggers() -> None:
+    """Test the transition trigger lookups"""
+
+    # Each (source, dest) pair has a single trigger
+    assert len(TRANSITION_TRIGGERS) == len(ProcessModel.transitions)
+    assert (
+        TRANSITION_TRIGGERS[(RecordState.pdf_prepared, RecordState.rev_included)]
+        == OperationsType.screen
+    )
+    assert (
+        RecordState.rev_included,
+        RecordState.pdf_prepared,
+    ) not in TRANSITION_TRIGGERS
+
+    # Reverse transitions have the trigger of the forward transition
+    assert (
+        REVERSIBLE_TRANSITION_TRIGGERS[
+            (RecordState.rev_included, RecordState.pdf_prepared)
+        ]
+        == OperationsType.screen
+    )
+    for transition, trigger in TRANSITION_TRIGGERS.items():
+        assert REVERSIBLE_TRANSITION_TRIGGERS[transition] == trigger
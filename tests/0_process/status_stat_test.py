@@ -60,6 +60,10 @@ def test_check_status_stats_attributes(  # type: ignore
     assert expected_stats.overall.rev_synthesized == 0
     assert expected_stats.completed_atomic_steps == 0
     assert expected_stats.completeness_condition
+    assert colrev.process.status.get_completeness_condition(
+        review_manager=base_repo_review_manager,
+        records=base_repo_review_manager.dataset.load_records_dict(),
+    )
 
     helpers.reset_commit(base_repo_review_manager, commit="load_commit")
     given_stats = base_repo_review_manager.get_status_stats()
@@ -76,6 +80,10 @@ def test_check_status_stats_attributes(  # type: ignore
     expected_stats.overall.md_retrieved = 1
     expected_stats.completeness_condition = False
     compare(expected_stats, given_stats)
+    assert not colrev.process.status.get_completeness_condition(
+        review_manager=base_repo_review_manager,
+        records=base_repo_review_manager.dataset.load_records_dict(),
+    )
     assert "1 to prepare" == given_stats.get_active_metadata_operation_info()
     assert "" == given_stats.get_active_pdf_operation_info()
     assert [OperationsType.prep] == given_stats.get_priority_operations()
@@ -109,3 +109,63 @@ def test_id_generation_selected(  # type: ignore
 
     actual = id_setter.set_ids(record_dict, selected_ids=["0001"])
     assert "WagnerLukyanenkoPare2022" in actual
+
+
+def test_set_ids_collisions(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test that set_ids makes colliding IDs unique across records."""
+
+    records = {
+        record_id: {
+            "ID": record_id,
+            "author": "Doe, John",
+            "year": "2021",
+            Fields.STATUS: status,
+        }
+        for record_id, status in [
+            ("0001", RecordState.md_imported),
+            ("0002", RecordState.md_prepared),
+            ("0003", RecordState.md_imported),
+            ("doe2021", RecordState.rev_synthesized),
+            ("Doe2021b", RecordState.md_processed),
+        ]
+    }
+
+    id_setter = colrev.record.record_id_setter.IDSetter(
+        id_pattern=IDPattern.first_author_year,
+        skip_local_index=True,
+        logger=base_repo_review_manager.report_logger,
+    )
+    actual = id_setter.set_ids(records)
+
+    # IDs of records that are md_processed (or later) are not changed
+    # and IDs are unique regardless of case
+    assert sorted(actual) == ["Doe2021a", "Doe2021b", "Doe2021c", "Doe2021d", "doe2021"]
+    assert all(record_id == record["ID"] for record_id, record in actual.items())
+
+
+@pytest.mark.parametrize(
+    "existing_ids, expected_id",
+    [
+        ([], "Doe2021"),
+        (["doe2021"], "Doe2021a"),
+        (["doe2021"] + [f"doe2021{chr(c)}" for c in range(97, 123)], "Doe2021aa"),
+    ],
+)
+def test_make_id_unique(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    existing_ids,
+    expected_id,
+) -> None:
+    """Test the suffixes used to make IDs unique."""
+
+    id_setter = colrev.record.record_id_setter.IDSetter(
+        id_pattern=IDPattern.first_author_year,
+        skip_local_index=True,
+        logger=base_repo_review_manager.report_logger,
+    )
+    assert (
+        id_setter._make_id_unique("Doe2021", existing_ids_lower=set(existing_ids))
+        == expected_id
+    )
@@ -119,3 +119,29 @@ def test_load(tmp_path, helpers) -> None:  # type: ignore
     Path("data/search/bib_data2.unkonwn").write_text("This is not a bib file.")
     with pytest.raises(NotImplementedError):
         colrev.loader.load_utils.get_nr_records(Path("data/search/bib_data2.unkonwn"))
+
+
+def test_get_nr_records_updated(tmp_path) -> None:  # type: ignore
+    """Test that the number of records is updated when the file changes"""
+    os.chdir(tmp_path)
+
+    bib_file = Path("records.bib")
+    bib_file.write_text("@article{a,\n title = {A}\n}\n")
+    assert 1 == colrev.loader.load_utils.get_nr_records(bib_file)
+    assert 1 == colrev.loader.load_utils.get_nr_records(bib_file)
+
+    bib_file.write_text(
+        "@comment{x}\n\n@article{a,\n title = {A}\n}\n\n@book{b,\n title = {B}\n}\n"
+    )
+    assert 2 == colrev.loader.load_utils.get_nr_records(bib_file)
+
+
+def test_get_nr_records_bom(tmp_path) -> None:  # type: ignore
+    """Test the number of records in a bib file starting with a byte order mark"""
+    os.chdir(tmp_path)
+
+    bib_file = Path("records.bib")
+    bib_file.write_bytes(
+        b"\xef\xbb\xbf@article{a,\n title = {A}\n}\n\n@article{b,\n title = {B}\n}\n"
+    )
+    assert 2 == colrev.loader.load_utils.get_nr_records(bib_file)
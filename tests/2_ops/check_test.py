@@ -43,6 +43,15 @@ def test_checks(  # type: ignore
         )
         assert expected == actual
 
+        # Files that are tracked but deleted from the working tree are skipped
+        (base_repo_review_manager.path / Path("readme.md")).unlink()
+        actual = checker.check_change_in_propagated_id(
+            prior_id="Srivastava2015",
+            new_id="Srivastava2015a",
+            project_context=base_repo_review_manager.path,
+        )
+        assert expected == actual
+
     search_sources = base_repo_review_manager.settings.sources
     actual = [s.model_dump() for s in search_sources]  # type: ignore
 
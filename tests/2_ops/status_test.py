@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 """Tests of the CoLRev status operation"""
+import typing
 from pathlib import Path
 
 import colrev.ops.check
+import colrev.process.status
 import colrev.review_manager
+import colrev.settings
+from colrev.constants import Fields
+from colrev.constants import RecordState
+from colrev.constants import ScreenCriterionType
 
 
 def test_get_analytics(  # type: ignore
@@ -75,6 +81,93 @@ def test_status_stats(  # type: ignore
     assert status_stats.atomic_steps == 9
 
 
+def test_status_stats_cache_record_state_change(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test that changes in record states invalidate the cached status stats"""
+
+    colrev.ops.check.CheckOperation(base_repo_review_manager)
+    records = base_repo_review_manager.dataset.load_records_dict()
+    record_dict = records["SrivastavaShainesh2015"]
+
+    record_dict[Fields.STATUS] = RecordState.rev_included
+    base_repo_review_manager.dataset.save_records_dict(records)
+    status_stats = base_repo_review_manager.get_status_stats()
+    assert status_stats.currently.rev_included == 1
+    assert status_stats.currently.rev_excluded == 0
+    # Cached
+    assert base_repo_review_manager.get_status_stats() == status_stats
+
+    # Note: the records file has the same size after the change
+    record_dict[Fields.STATUS] = RecordState.rev_excluded
+    base_repo_review_manager.dataset.save_records_dict(records)
+    status_stats = base_repo_review_manager.get_status_stats()
+    assert status_stats.currently.rev_included == 0
+    assert status_stats.currently.rev_excluded == 1
+
+
+def test_status_stats_cache_round_trip(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test that the status stats cache is reused across review managers"""
+
+    def load_cached_status_stats() -> (
+        typing.Optional[colrev.process.status.StatusStats]
+    ):
+        review_manager = colrev.review_manager.ReviewManager(
+            path_str=str(base_repo_review_manager.path)
+        )
+        _, status_stats = review_manager._get_cached_status_stats()
+        return status_stats
+
+    colrev.ops.check.CheckOperation(base_repo_review_manager)
+    base_repo_review_manager.get_status_stats()
+
+    cached_status_stats = load_cached_status_stats()
+    assert cached_status_stats is not None
+    expected = colrev.process.status.get_status_stats(
+        review_manager=base_repo_review_manager,
+        records=base_repo_review_manager.dataset.load_records_dict(),
+    )
+    assert cached_status_stats == expected
+
+    # Records change
+    records = base_repo_review_manager.dataset.load_records_dict()
+    records["SrivastavaShainesh2015"][Fields.STATUS] = RecordState.rev_included
+    base_repo_review_manager.dataset.save_records_dict(records)
+    assert load_cached_status_stats() is None
+    base_repo_review_manager.get_status_stats()
+    assert load_cached_status_stats() is not None
+
+    # Search file change
+    search_file = base_repo_review_manager.path / Path(
+        base_repo_review_manager.settings.sources[0].filename
+    )
+    with open(search_file, "a", encoding="utf-8") as file:
+        file.write("\n")
+    assert load_cached_status_stats() is None
+    base_repo_review_manager.get_status_stats()
+    assert load_cached_status_stats() is not None
+
+    # Settings change
+    base_repo_review_manager.settings.screen.criteria["new_criterion"] = (
+        colrev.settings.ScreenCriterion(
+            explanation="A new criterion",
+            comment=None,
+            criterion_type=ScreenCriterionType.inclusion_criterion,
+        )
+    )
+    base_repo_review_manager.save_settings()
+    assert load_cached_status_stats() is None
+
+    # Invalid cache files are treated as a cache miss
+    base_repo_review_manager.get_status_stats()
+    cache_path = base_repo_review_manager._get_status_stats_cache_path()
+    cache_lines = cache_path.read_text(encoding="utf-8").splitlines()
+    cache_path.write_text(cache_lines[0] + "\n{}\n", encoding="utf-8")
+    assert load_cached_status_stats() is None
+
+
 def test_get_review_status_report(  # type: ignore
     base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
 ) -> None: